@@ -3,10 +3,10 @@
 
 from pathlib import Path
 
-from rng_viz.cli import resolve_capture_path
-
 
 def demo():
+    from rng_viz.cli import resolve_capture_path
+
     print("🎯 Demo: Automatic Directory Creation for RNG Visualizer\n")
 
     print("Example 1: Non-existent ./captures/ directory")
@@ -1,12 +1,13 @@
 """Statistical analysis for random bitstreams."""
 
 import math
-from collections import deque
-from dataclasses import dataclass
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from functools import cached_property
+from statistics import NormalDist
 from typing import NamedTuple
 
 import numpy as np
-from scipy import stats
 
 
 class AnomalyResult(NamedTuple):
@@ -19,32 +20,278 @@ class AnomalyResult(NamedTuple):
     test_type: str
 
 
+# Shared result for the common case where a test finds nothing
+_EMPTY: tuple[AnomalyResult, ...] = ()
+
+# Number of set bits in each byte value
+POPCOUNT = tuple(i.bit_count() for i in range(256))
+
+# Number of 0<->1 transitions between adjacent bits within each byte value
+INNER_TRANSITIONS = tuple((i ^ (i >> 1)).bit_count() - (i >> 7) for i in range(256))
+
+# Transitions added by appending a byte after one whose MSB is ``prev_msb``,
+# indexed by ``(prev_msb << 8) | byte``: its inner transitions plus the seam
+ENTRY_TRANSITIONS = tuple(
+    INNER_TRANSITIONS[i & 0xFF] + ((i >> 8) ^ (i & 1)) for i in range(512)
+)
+
+# Array versions of the tables for gathers over whole byte arrays
+POPCOUNT_LUT = np.array(POPCOUNT, dtype=np.uint8)
+INNER_TRANSITIONS_LUT = np.array(INNER_TRANSITIONS, dtype=np.uint8)
+
+# Each byte value and its square, for moments taken from a byte histogram
+BYTE_VALUES = np.arange(256, dtype=np.int64)
+BYTE_SQUARES = BYTE_VALUES * BYTE_VALUES
+
+
+def _seam_transition(earlier: int, later: int) -> int:
+    """Whether the bitstream flips across the boundary between two bytes.
+
+    Bits are read least significant first, so the last bit of ``earlier`` is
+    its MSB and the first bit of ``later`` is its LSB.
+    """
+    return (earlier >> 7) ^ (later & 1)
+
+
+def _segment_counts(segment: np.ndarray) -> tuple[int, int, np.ndarray]:
+    """Count ones, bit transitions and byte values in a contiguous byte run.
+
+    Args:
+        segment: Bytes in stream order
+
+    Returns:
+        Tuple of (ones count, transitions count, 256-bin byte histogram)
+    """
+    # Read as one little-endian integer, bit k of the bitstream is bit k of
+    # ``bits``, so both counts become single native popcounts. Segments are
+    # small, where this beats per-byte table gathers by a wide margin.
+    bits = int.from_bytes(segment.tobytes(), "little")
+    ones = bits.bit_count()
+    # Bit k of bits ^ (bits >> 1) is set where bits k and k+1 differ; the
+    # mask drops the top bit, which has no successor in the segment
+    n_bits = 8 * len(segment)
+    transitions = ((bits ^ (bits >> 1)) & ((1 << (n_bits - 1)) - 1)).bit_count()
+    histogram = np.bincount(segment, minlength=256)
+    return ones, transitions, histogram
+
+
+def _window_series(
+    stream: np.ndarray, window_size: int, sum_sq: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Window counts after each byte appended to a full window.
+
+    Args:
+        stream: The window's bytes from oldest to newest, then the new bytes
+        window_size: Window size in bytes
+        sum_sq: Sum of squared byte histogram counts of the initial window
+
+    Returns:
+        Tuple of (ones count, transitions count, sum of squared histogram
+        counts) arrays, with one entry per new byte for the window that
+        ends on it
+    """
+    length = len(stream)
+    ends = np.arange(window_size, length)
+    starts = ends - window_size + 1
+
+    ones = np.zeros(length + 1, dtype=np.int64)
+    np.cumsum(POPCOUNT_LUT[stream], out=ones[1:])
+    inner = np.zeros(length + 1, dtype=np.int64)
+    np.cumsum(INNER_TRANSITIONS_LUT[stream], out=inner[1:])
+    # seams[j + 1] counts the transitions across byte boundaries up to byte j
+    seams = np.zeros(length + 1, dtype=np.int64)
+    np.cumsum((stream[:-1] >> 7) ^ (stream[1:] & 1), out=seams[2:])
+
+    window_ones = ones[ends + 1] - ones[starts]
+    transitions = inner[ends + 1] - inner[starts] + seams[ends + 1] - seams[starts + 1]
+
+    # Each step evicts the oldest byte u and then adds the new byte v,
+    # changing the sum of squares by -(2 * count(u) - 1) and +(2 * count(v) + 1),
+    # with each count taken over the window at that point. The counts come
+    # from binary searches in the stream's indices sorted by (byte value,
+    # index), keyed as value * length + index. Searching in key order keeps
+    # the needles sorted, which is several times faster than in stream order.
+    order = np.argsort(stream, kind="stable")
+    keys = stream[order].astype(np.int64) * length + order
+    rank = np.arange(length)
+
+    # Earlier copies of v still in the window: keys between v's key and the
+    # key of the window's first index with the same value
+    is_added = order >= window_size
+    added_count = np.empty(length - window_size, dtype=np.int64)
+    added_count[order[is_added] - window_size] = rank[is_added] - np.searchsorted(
+        keys, keys[is_added] - (window_size - 1)
+    )
+
+    # Copies of u in the window before eviction: keys from u's own key up to
+    # the key of the index one window later with the same value
+    is_evicted = order < length - window_size
+    evicted_count = np.empty(length - window_size, dtype=np.int64)
+    evicted_count[order[is_evicted]] = (
+        np.searchsorted(keys, keys[is_evicted] + window_size) - rank[is_evicted]
+    )
+
+    window_sum_sq = sum_sq + np.cumsum(2 * (added_count - evicted_count) + 2)
+
+    return window_ones, transitions, window_sum_sq
+
+
+def _ring_read(buf: np.ndarray, start: int, n: int) -> np.ndarray:
+    """Read ``n`` entries of a ring buffer from ``start``.
+
+    Returns a view unless the entries wrap around the end of the buffer.
+    """
+    end = start + n
+    if end <= len(buf):
+        return buf[start:end]
+    return np.concatenate((buf[start:], buf[: end - len(buf)]))
+
+
+def _ring_write(buf: np.ndarray, start: int, data: np.ndarray) -> None:
+    """Write ``data`` into a ring buffer from ``start``, wrapping at the end."""
+    first = min(len(data), len(buf) - start)
+    buf[start : start + first] = data[:first]
+    buf[: len(data) - first] = data[first:]
+
+
 @dataclass
 class StatisticalWindow:
-    """Moving window for statistical analysis."""
+    """Moving window for statistical analysis, backed by a ring buffer.
+
+    The ones count, bit transition count and byte histogram are maintained
+    incrementally as bytes enter and leave the window, so each update is O(1).
+    """
 
     window_size: int
-    data: deque = None
+    # The ring buffer's storage; buf is a NumPy view of the same memory.
+    # Single bytes are read and written through raw, which is several
+    # times cheaper than indexing the array for one element.
+    raw: bytearray = field(init=False, repr=False)
+    buf: np.ndarray = field(init=False, repr=False)
+    idx: int = field(init=False, default=0)
+    count: int = field(init=False, default=0)
+    ones_count: int = field(init=False, default=0)
+    transitions: int = field(init=False, default=0)
+    histogram: np.ndarray = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
-        if self.data is None:
-            self.data = deque(maxlen=self.window_size)
+        self.raw = bytearray(self.window_size)
+        self.buf = np.frombuffer(self.raw, dtype=np.uint8)
+        self.histogram = np.zeros(256, dtype=np.int64)
 
     def add_byte(self, byte_val: int) -> None:
-        """Add a byte to the window."""
-        self.data.append(byte_val)
+        """Add a byte to the window, overwriting the oldest once full."""
+        size = self.window_size
+        idx = self.idx
+
+        if self.count == size:
+            # Evict the oldest byte along with its seam to the next-oldest
+            evicted = self.raw[idx]
+            self.ones_count -= POPCOUNT[evicted]
+            self.transitions -= INNER_TRANSITIONS[evicted]
+            self.histogram[evicted] -= 1
+            if size > 1:
+                next_oldest = self.raw[(idx + 1) % size]
+                self.transitions -= (evicted >> 7) ^ (next_oldest & 1)
+        else:
+            self.count += 1
+
+        if self.count > 1:
+            prev_msb = self.raw[idx - 1] >> 7
+            self.transitions += ENTRY_TRANSITIONS[(prev_msb << 8) | byte_val]
+        else:
+            self.transitions += INNER_TRANSITIONS[byte_val]
+        self.ones_count += POPCOUNT[byte_val]
+        self.histogram[byte_val] += 1
+
+        self.raw[idx] = byte_val
+        self.idx = (idx + 1) % size
+
+    def extend(self, data: bytes | np.ndarray) -> None:
+        """Add many bytes at once, updating the counters with vectorized gathers.
+
+        Args:
+            data: Bytes in stream order
+        """
+        if not isinstance(data, np.ndarray):
+            data = np.frombuffer(data, dtype=np.uint8)
+        size = self.window_size
+        n = len(data)
+        if n == 0:
+            return
+
+        if n >= size:
+            # Only the last window's worth survives; rebuild the counters
+            self.buf[:] = data[-size:]
+            self.idx = 0
+            self.count = size
+            self.ones_count, self.transitions, self.histogram = _segment_counts(
+                self.buf
+            )
+            return
+
+        oldest = (self.idx - self.count) % size
+        n_evicted = max(0, self.count + n - size)
+        if n_evicted:
+            evicted = _ring_read(self.buf, oldest, n_evicted)
+            ones, transitions, histogram = _segment_counts(evicted)
+            self.ones_count -= ones
+            self.transitions -= transitions
+            self.transitions -= _seam_transition(
+                int(evicted[-1]), self.raw[(oldest + n_evicted) % size]
+            )
+            self.histogram -= histogram
+
+        ones, transitions, histogram = _segment_counts(data)
+        if self.count:
+            transitions += _seam_transition(self.raw[self.idx - 1], int(data[0]))
+        self.ones_count += ones
+        self.transitions += transitions
+        self.histogram += histogram
+
+        _ring_write(self.buf, self.idx, data)
+        self.idx = (self.idx + n) % size
+        self.count = min(size, self.count + n)
 
     def is_full(self) -> bool:
         """Check if window is full."""
-        return len(self.data) == self.window_size
+        return self.count >= self.window_size
+
+    def as_array(self) -> np.ndarray:
+        """Get the window contents in storage order.
+
+        Suitable for order-independent statistics (frequency, chi-square).
+        """
+        if self.is_full():
+            return self.buf
+        return self.buf[: self.count]
+
+    def as_ordered(self) -> np.ndarray:
+        """Get the window contents from oldest to newest byte."""
+        if not self.is_full() or self.idx == 0:
+            return self.as_array()
+        return np.concatenate((self.buf[self.idx :], self.buf[: self.idx]))
+
+    def sum_of_squares(self) -> int:
+        """Sum of the squared byte histogram counts, for the chi-square test."""
+        return int(self.histogram @ self.histogram)
+
+    def get_bytes(self) -> bytes:
+        """Get the window contents from oldest to newest as a single bytes copy."""
+        return self.as_ordered().tobytes()
 
-    def get_bits(self) -> list[int]:
-        """Get all bits from the current window."""
-        bits = []
-        for byte_val in self.data:
-            for i in range(8):
-                bits.append((byte_val >> i) & 1)
-        return bits
+    def get_bits(self) -> np.ndarray:
+        """Get all bits from the current window (least significant bit first).
+
+        The analyzer reads the incremental counters instead; this expansion
+        is only for callers that need the individual bits.
+        """
+        return np.unpackbits(self.as_ordered(), bitorder="little")
+
+
+def _two_tailed_p(z_score: float) -> float:
+    """Two-tailed p-value for a standard normal z-score."""
+    return math.erfc(abs(z_score) / math.sqrt(2))
 
 
 class RandomnessAnalyzer:
@@ -59,6 +306,11 @@ class RandomnessAnalyzer:
         """
         self.window_size = window_size
         self.sensitivity = sensitivity
+
+        # Critical value at the sensitivity threshold, so tests can skip the
+        # exact p-value when a statistic is nowhere near the tail. It is
+        # nudged slightly inward so borderline cases still get the exact check.
+        self._z_crit = -NormalDist().inv_cdf(sensitivity / 2) * (1 - 1e-9)
         self.window = StatisticalWindow(window_size=window_size)
         self.position = 0
         self.anomalies: list[AnomalyResult] = []
@@ -71,145 +323,239 @@ class RandomnessAnalyzer:
             1.0: "",  # Not significant
         }
 
-    def add_byte(self, byte_val: int) -> list[AnomalyResult]:
+    @cached_property
+    def _chi2_crit(self) -> float:
+        """Chi-square (255 dof) critical value at the sensitivity threshold.
+
+        Computed on first use so scipy is only imported once a window fills.
+        """
+        from scipy.special import chdtri
+
+        return float(chdtri(255, self.sensitivity)) * (1 - 1e-9)
+
+    def add_byte(self, byte_val: int) -> Sequence[AnomalyResult]:
         """Add a byte and analyze for anomalies.
 
         Args:
             byte_val: Byte value (0-255)
 
         Returns:
-            List of detected anomalies in this position
+            Anomalies detected at this position (usually empty)
         """
         self.window.add_byte(byte_val)
         self.position += 1
 
-        anomalies = []
+        if not self.window.is_full():
+            return _EMPTY
+
+        return self._run_tests()
+
+    def add_bytes(self, chunk: bytes | np.ndarray) -> list[AnomalyResult]:
+        """Add a chunk of bytes and analyze each position for anomalies.
 
-        if self.window.is_full():
-            # Run multiple statistical tests
-            anomalies.extend(self._test_frequency())
-            anomalies.extend(self._test_runs())
-            anomalies.extend(self._test_chi_square())
+        Gives the same results as calling add_byte for every byte. The window
+        counts after each byte are computed for the whole chunk with array
+        operations, and the exact tests only run at positions where a
+        statistic comes close to its critical value.
 
+        Args:
+            chunk: Byte values in stream order
+
+        Returns:
+            List of anomalies detected in the chunk, in stream order
+        """
+        if not isinstance(chunk, np.ndarray):
+            chunk = np.frombuffer(chunk, dtype=np.uint8)
+        window = self.window
+        anomalies: list[AnomalyResult] = []
+
+        if not window.is_full():
+            # Tests start with the byte that fills the window
+            head = chunk[: self.window_size - window.count]
+            chunk = chunk[len(head) :]
+            window.extend(head)
+            self.position += len(head)
+            if len(head) and window.is_full():
+                anomalies.extend(self._run_tests())
+            if not len(chunk):
+                return anomalies
+
+        ones, transitions, sum_sq = _window_series(
+            np.concatenate((window.as_ordered(), chunk)),
+            self.window_size,
+            window.sum_of_squares(),
+        )
+        start_position = self.position
+        for i in np.flatnonzero(self._near_critical(ones, transitions, sum_sq)):
+            self.position = start_position + int(i) + 1
+            anomalies.extend(
+                self._test_counts(int(ones[i]), int(transitions[i]) + 1, int(sum_sq[i]))
+            )
+
+        window.extend(chunk)
+        self.position = start_position + len(chunk)
         return anomalies
 
-    def _test_frequency(self) -> list[AnomalyResult]:
-        """Test for frequency deviations (bias toward 0s or 1s)."""
-        bits = self.window.get_bits()
-        n_bits = len(bits)
-        n_ones = sum(bits)
-        n_zeros = n_bits - n_ones
+    def _near_critical(
+        self, ones: np.ndarray, transitions: np.ndarray, sum_sq: np.ndarray
+    ) -> np.ndarray:
+        """Mask of window positions where any test statistic nears its tail.
+
+        The statistics are computed in floating point with a small margin,
+        so every position the exact tests would flag is included.
+        """
+        margin = 1 - 1e-6
+        n = self.window_size * 8
+        z_crit = self._z_crit * margin
+
+        z_frequency = (ones / n - 0.5) / math.sqrt(0.25 / n)
+        near = np.abs(z_frequency) >= z_crit
+
+        nn = 2.0 * ones * (n - ones)
+        variance = nn * (nn - n) / (n * n * (n - 1.0))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            z_runs = (transitions + 1 - (nn / n + 1)) / np.sqrt(variance)
+        near |= (variance > 0) & (np.abs(z_runs) >= z_crit)
+
+        if self.window_size >= 50:
+            chi2 = sum_sq / (self.window_size / 256) - self.window_size
+            near |= chi2 >= self._chi2_crit * margin
+        return near
+
+    def _run_tests(self) -> tuple[AnomalyResult, ...]:
+        """Run all statistical tests against the current window."""
+        window = self.window
+        return self._test_counts(
+            window.ones_count, window.transitions + 1, window.sum_of_squares()
+        )
+
+    def _test_counts(
+        self, n_ones: int, runs: int, sum_sq: int
+    ) -> tuple[AnomalyResult, ...]:
+        """Run all statistical tests on a full window's counts.
 
-        # Expected is 50/50 split
-        expected_ones = n_bits / 2
+        Args:
+            n_ones: Number of set bits in the window
+            runs: Number of runs of equal bits in the window
+            sum_sq: Sum of the squared byte histogram counts
+        """
+        n_bits = self.window_size * 8
+
+        # Concatenating empty tuples yields the shared empty tuple, so the
+        # common no-anomaly case allocates nothing
+        return (
+            self._test_frequency(n_ones, n_bits)
+            + self._test_runs(runs, n_ones, n_bits)
+            + self._test_chi_square(sum_sq, self.window_size)
+        )
 
-        # Z-test for proportion
+    def _test_frequency(self, n_ones: int, n_bits: int) -> tuple[AnomalyResult, ...]:
+        """Test for frequency deviations (bias toward 0s or 1s)."""
+        # Z-test for proportion against an expected 50/50 split
         p_hat = n_ones / n_bits
         expected_p = 0.5
 
         # Standard error for proportion
         se = math.sqrt(expected_p * (1 - expected_p) / n_bits)
         z_score = (p_hat - expected_p) / se
+        if abs(z_score) < self._z_crit:
+            return _EMPTY
 
         # Two-tailed test
-        p_value = 2 * (1 - stats.norm.cdf(abs(z_score)))
-
-        anomalies = []
-        if p_value < self.sensitivity:
-            sig_level = self._get_significance_level(p_value)
-            anomalies.append(
-                AnomalyResult(
-                    position=self.position,
-                    z_score=z_score,
-                    p_value=p_value,
-                    significance_level=sig_level,
-                    test_type="frequency",
-                )
-            )
-
-        return anomalies
+        p_value = _two_tailed_p(z_score)
+
+        if p_value >= self.sensitivity:
+            return _EMPTY
+
+        return (
+            AnomalyResult(
+                position=self.position,
+                z_score=z_score,
+                p_value=p_value,
+                significance_level=self._get_significance_level(p_value),
+                test_type="frequency",
+            ),
+        )
 
-    def _test_runs(self) -> list[AnomalyResult]:
+    def _test_runs(
+        self, runs: int, n_ones: int, n_bits: int
+    ) -> tuple[AnomalyResult, ...]:
         """Test for runs (consecutive sequences of same bit)."""
-        bits = self.window.get_bits()
-        if len(bits) < 2:
-            return []
-
-        # Count runs
-        runs = 1
-        for i in range(1, len(bits)):
-            if bits[i] != bits[i - 1]:
-                runs += 1
-
-        n = len(bits)
-        n_ones = sum(bits)
+        if n_bits < 2:
+            return _EMPTY
+
+        n = n_bits
         n_zeros = n - n_ones
 
         if n_ones == 0 or n_zeros == 0:
-            return []  # Can't compute runs test
-
-        # Expected number of runs
-        expected_runs = (2 * n_ones * n_zeros) / n + 1
+            return _EMPTY  # Can't compute runs test
 
-        # Variance of runs
-        variance = (2 * n_ones * n_zeros * (2 * n_ones * n_zeros - n)) / (
-            n * n * (n - 1)
-        )
+        # Expected number of runs and its variance
+        nn = 2 * n_ones * n_zeros
+        expected_runs = nn / n + 1
+        variance = nn * (nn - n) / (n * n * (n - 1))
 
         if variance <= 0:
-            return []
+            return _EMPTY
 
         # Z-score for runs test
         z_score = (runs - expected_runs) / math.sqrt(variance)
-        p_value = 2 * (1 - stats.norm.cdf(abs(z_score)))
-
-        anomalies = []
-        if p_value < self.sensitivity:
-            sig_level = self._get_significance_level(p_value)
-            anomalies.append(
-                AnomalyResult(
-                    position=self.position,
-                    z_score=z_score,
-                    p_value=p_value,
-                    significance_level=sig_level,
-                    test_type="runs",
-                )
-            )
+        if abs(z_score) < self._z_crit:
+            return _EMPTY
+
+        p_value = _two_tailed_p(z_score)
+
+        if p_value >= self.sensitivity:
+            return _EMPTY
+
+        return (
+            AnomalyResult(
+                position=self.position,
+                z_score=z_score,
+                p_value=p_value,
+                significance_level=self._get_significance_level(p_value),
+                test_type="runs",
+            ),
+        )
 
-        return anomalies
+    def _test_chi_square(self, sum_sq: int, n_bytes: int) -> tuple[AnomalyResult, ...]:
+        """Chi-square test for uniformity of byte values.
 
-    def _test_chi_square(self) -> list[AnomalyResult]:
-        """Chi-square test for uniformity of byte values."""
-        byte_values = list(self.window.data)
-        if len(byte_values) < 50:  # Need sufficient sample size
-            return []
+        Args:
+            sum_sq: Sum of the squared count of each byte value in the window
+            n_bytes: Number of bytes in the window
+        """
+        if n_bytes < 50:  # Need sufficient sample size
+            return _EMPTY
 
-        # Count frequency of each byte value
-        observed_freq = np.bincount(byte_values, minlength=256)
-        expected_freq = len(byte_values) / 256
+        expected_freq = n_bytes / 256
 
-        # Chi-square test
-        chi2_stat = np.sum((observed_freq - expected_freq) ** 2 / expected_freq)
+        # Chi-square test: the sum of (observed - expected)^2 / expected over
+        # all 256 values, expanded so only the squared counts are needed
+        chi2_stat = sum_sq / expected_freq - n_bytes
         dof = 255  # degrees of freedom
-        p_value = 1 - stats.chi2.cdf(chi2_stat, dof)
+        if chi2_stat < self._chi2_crit:
+            return _EMPTY
+
+        from scipy.special import chdtrc
+
+        p_value = float(chdtrc(dof, chi2_stat))
 
         # Convert to z-score approximation for consistency
         z_score = (chi2_stat - dof) / math.sqrt(2 * dof)
 
-        anomalies = []
-        if p_value < self.sensitivity:
-            sig_level = self._get_significance_level(p_value)
-            anomalies.append(
-                AnomalyResult(
-                    position=self.position,
-                    z_score=z_score,
-                    p_value=p_value,
-                    significance_level=sig_level,
-                    test_type="chi_square",
-                )
-            )
-
-        return anomalies
+        if p_value >= self.sensitivity:
+            return _EMPTY
+
+        return (
+            AnomalyResult(
+                position=self.position,
+                z_score=z_score,
+                p_value=p_value,
+                significance_level=self._get_significance_level(p_value),
+                test_type="chi_square",
+            ),
+        )
 
     def _get_significance_level(self, p_value: float) -> str:
         """Get significance level string based on p-value."""
@@ -223,16 +569,23 @@ class RandomnessAnalyzer:
         if not self.window.is_full():
             return {}
 
-        bits = self.window.get_bits()
-        byte_values = list(self.window.data)
+        n_bytes = self.window.count
+        n_bits = n_bytes * 8
+        n_ones = self.window.ones_count
+
+        # The window keeps its byte histogram up to date, so the moments come
+        # from 256 bins rather than a pass over every byte in the window
+        histogram = self.window.histogram
+        byte_mean = int(histogram @ BYTE_VALUES) / n_bytes
+        byte_var = int(histogram @ BYTE_SQUARES) / n_bytes - byte_mean * byte_mean
 
         return {
-            "total_bits": len(bits),
-            "ones_count": sum(bits),
-            "zeros_count": len(bits) - sum(bits),
-            "ones_ratio": sum(bits) / len(bits),
-            "byte_mean": np.mean(byte_values),
-            "byte_std": np.std(byte_values),
+            "total_bits": n_bits,
+            "ones_count": n_ones,
+            "zeros_count": n_bits - n_ones,
+            "ones_ratio": n_ones / n_bits,
+            "byte_mean": byte_mean,
+            "byte_std": math.sqrt(max(0.0, byte_var)),
             "total_anomalies": len(self.anomalies),
             "current_position": self.position,
         }
@@ -1,11 +1,56 @@
 """Command-line interface for RNG Visualizer."""
 
+import stat
 from datetime import datetime
 from pathlib import Path
 
 import click
 
 
+def _stat_path(p: Path) -> tuple[bool, bool]:
+    """Check whether a path exists and is a directory with a single stat() call.
+
+    Returns:
+        Tuple of (exists, is_dir)
+    """
+    try:
+        st = p.stat()
+    except (FileNotFoundError, NotADirectoryError):
+        return False, False
+    return True, stat.S_ISDIR(st.st_mode)
+
+
+def _is_directory_path(p: Path, is_dir: bool) -> bool:
+    """Check if path is intended to be a directory.
+
+    Args:
+        p: Input path
+        is_dir: Whether the path already exists as a directory
+    """
+    # If it exists and is a directory, obviously yes
+    if is_dir:
+        return True
+
+    # If it ends with a slash, it's a directory
+    path_str = str(p)
+    if path_str.endswith("/") or path_str.endswith("\\"):
+        return True
+
+    # If it has no file extension and the name doesn't look like a filename, assume directory
+    # Common directory patterns: captures, data, experiments, etc.
+    if not p.suffix and not p.name.startswith("."):
+        return True
+
+    return False
+
+
+def _generate_timestamped_filename() -> str:
+    """Generate a unique timestamped filename."""
+    # Drop the last 3 digits of the microseconds to get milliseconds
+    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S-%f")[:-3]
+    return f"rng_capture_{timestamp}.csv"
+
+
 def resolve_capture_path(path: Path) -> Path:
     """Resolve the capture file path, auto-generating filename if directory provided.
 
@@ -18,55 +63,30 @@ def resolve_capture_path(path: Path) -> Path:
     Raises:
         click.ClickException: If path issues are encountered
     """
+    exists, is_dir = _stat_path(path)
 
-    def is_directory_path(p: Path) -> bool:
-        """Check if path is intended to be a directory."""
-        # If it exists and is a directory, obviously yes
-        if p.exists() and p.is_dir():
-            return True
-
-        # If it ends with a slash, it's a directory
-        path_str = str(p)
-        if path_str.endswith("/") or path_str.endswith("\\"):
-            return True
-
-        # If it has no file extension and the name doesn't look like a filename, assume directory
-        # Common directory patterns: captures, data, experiments, etc.
-        if not p.suffix and not p.name.startswith("."):
-            return True
-
-        return False
-
-    def generate_timestamped_filename() -> str:
-        """Generate a unique timestamped filename."""
-        now = datetime.now()
-        timestamp = now.strftime("%Y-%m-%d_%H-%M-%S")
-        microseconds = now.strftime("%f")[
-            :3
-        ]  # First 3 digits of microseconds (milliseconds)
-        return f"rng_capture_{timestamp}-{microseconds}.csv"
-
-    if is_directory_path(path):
+    if _is_directory_path(path, is_dir):
         # This is intended to be a directory - create it if needed
-        if not path.exists():
+        if not exists:
             click.echo(f"Creating directory: {path}")
             path.mkdir(parents=True, exist_ok=True)
 
         # Generate timestamped filename in the directory
-        filename = generate_timestamped_filename()
+        filename = _generate_timestamped_filename()
         resolved_path = path / filename
         click.echo(f"Auto-generating filename: {resolved_path}")
         return resolved_path
     else:
         # This looks like a specific file path
+        parent_exists, _ = _stat_path(path.parent)
         if path.suffix:
             # Has file extension - definitely a file
             # Create parent directory if it doesn't exist
-            if not path.parent.exists():
+            if not parent_exists:
                 click.echo(f"Creating parent directory: {path.parent}")
                 path.parent.mkdir(parents=True, exist_ok=True)
             return path
-        elif path.parent.exists():
+        elif parent_exists:
             # Parent exists and no extension - treat as file in existing directory
             return path
         else:
@@ -75,17 +95,16 @@ def resolve_capture_path(path: Path) -> Path:
                 f"Path '{path}' is ambiguous. Treat as directory and auto-generate filename?"
             ):
                 path.mkdir(parents=True, exist_ok=True)
-                filename = generate_timestamped_filename()
+                filename = _generate_timestamped_filename()
                 resolved_path = path / filename
                 click.echo(
                     f"Created directory and auto-generating filename: {resolved_path}"
                 )
                 return resolved_path
             else:
-                # Treat as file path - create parent directory if needed
-                if not path.parent.exists():
-                    click.echo(f"Creating parent directory: {path.parent}")
-                    path.parent.mkdir(parents=True, exist_ok=True)
+                # Treat as file path - the parent is known not to exist here
+                click.echo(f"Creating parent directory: {path.parent}")
+                path.parent.mkdir(parents=True, exist_ok=True)
                 return path
 
 
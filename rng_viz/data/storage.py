@@ -1,12 +1,21 @@
 """Data storage and loading for bitstream captures."""
 
-import csv
+import bisect
+import io
 import json
-from collections.abc import Iterator
-from dataclasses import asdict, dataclass
+import os
+import struct
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
 from datetime import datetime
+from itertools import accumulate, starmap
 from pathlib import Path
-from typing import Any
+from typing import IO, TYPE_CHECKING, Any
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 @dataclass
@@ -26,8 +35,69 @@ class CaptureMetadata:
         """Create from dictionary."""
         return cls(**data)
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "timestamp": self.timestamp,
+            "device_info": dict(self.device_info),
+            "window_size": self.window_size,
+            "sensitivity": self.sensitivity,
+            "total_bytes": self.total_bytes,
+            "total_anomalies": self.total_anomalies,
+            "duration_seconds": self.duration_seconds,
+        }
+
 
-@dataclass
+# Column order of the CSV data section
+RECORD_FIELDS = (
+    "position",
+    "timestamp",
+    "byte_value",
+    "anomaly_type",
+    "z_score",
+    "p_value",
+    "significance",
+)
+
+# Rows between entries of the position index written alongside CSV captures
+INDEX_INTERVAL = 10_000
+
+# Read buffer size for sequential scans of capture files
+SCAN_BUFFER_SIZE = 1 << 20
+
+# Column dtypes for pandas parsing of the CSV data section
+_CSV_DTYPES = {
+    "position": "int64",
+    "timestamp": "float64",
+    "byte_value": "uint8",
+    "anomaly_type": "object",
+    "z_score": "float64",
+    "p_value": "float64",
+    "significance": "object",
+}
+
+# Binary (.rngbin) capture format: BINARY_MAGIC, a little-endian uint32
+# length, the metadata JSON, zero padding to a multiple of 8 bytes, then
+# fixed-size records. flags holds the anomaly type code in its low two bits
+# and the significance code in the next two; missing z/p values are NaN.
+BINARY_MAGIC = b"RNGBIN01"
+BINARY_RECORD_DTYPE = np.dtype(
+    [
+        ("position", "<i8"),
+        ("timestamp", "<f8"),
+        ("byte_value", "u1"),
+        ("flags", "u1"),
+        ("z_score", "<f4"),
+        ("p_value", "<f4"),
+    ]
+)
+ANOMALY_MASK = 0b11
+SIGNIFICANCE_SHIFT = 2
+_ANOMALY_TYPES = (None, "frequency", "runs", "chi_square")
+_SIGNIFICANCE_LEVELS = (None, "*", "**", "***")
+
+
+@dataclass(slots=True)
 class BitstreamRecord:
     """Single record in the bitstream."""
 
@@ -40,63 +110,582 @@ class BitstreamRecord:
     significance: str | None = None
 
 
+# A record as a plain tuple, in RECORD_FIELDS order
+Row = tuple[int, float, int, str | None, float | None, float | None, str | None]
+
+
+def _open_capture(filepath: Path, mode: str = "r", buffering: int = -1) -> IO:
+    """Open a capture file for reading, decompressing ``.zst`` files."""
+    if filepath.suffix != ".zst":
+        return open(filepath, mode, buffering=buffering)
+
+    zstandard = _import_zstandard()
+    reader = io.BufferedReader(
+        zstandard.open(filepath, "rb"),
+        buffer_size=max(buffering, io.DEFAULT_BUFFER_SIZE),
+    )
+    return reader if "b" in mode else io.TextIOWrapper(reader)
+
+
+def _open_for_scan(filepath: Path, mode: str = "r") -> IO:
+    """Open a capture file for a sequential scan.
+
+    Uses a large read buffer so each read syscall moves a big block, and
+    where supported hints the kernel to read ahead aggressively.
+    """
+    f = _open_capture(filepath, mode, buffering=SCAN_BUFFER_SIZE)
+    if hasattr(os, "posix_fadvise") and filepath.suffix != ".zst":
+        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    return f
+
+
+def _index_path(filepath: Path) -> Path:
+    """Path of the position index sidecar for a CSV capture file."""
+    return filepath.with_name(filepath.name + ".idx")
+
+
+def _parse_line(line: bytes) -> BitstreamRecord:
+    """Parse one CSV data line into a record."""
+    fields = line.rstrip(b"\r\n").split(b",")
+    return BitstreamRecord(
+        position=int(fields[0]),
+        timestamp=float(fields[1]),
+        byte_value=int(fields[2]),
+        anomaly_type=fields[3].decode() if fields[3] else None,
+        z_score=float(fields[4]) if fields[4] else None,
+        p_value=float(fields[5]) if fields[5] else None,
+        significance=fields[6].decode() if fields[6] else None,
+    )
+
+
+def _format_timestamps(timestamps: np.ndarray) -> list[str]:
+    """Format timestamps as CSV fields, formatting each run of equal values once.
+
+    Captured bytes share their chunk's read time, so a batch holds a few
+    long runs of identical timestamps.
+    """
+    if not len(timestamps):
+        return []
+    starts = np.flatnonzero(np.diff(timestamps, prepend=np.nan))
+    text = np.array([f"{t:.6f}" for t in timestamps[starts].tolist()], dtype=object)
+    return np.repeat(text, np.diff(starts, append=len(timestamps))).tolist()
+
+
+def _format_record(record: BitstreamRecord) -> str:
+    """Format a record as one CSV line.
+
+    None fields become empty columns. The string fields are fixed
+    identifiers ("frequency", "***", ...) and never need quoting.
+    """
+    return (
+        f"{record.position},{record.timestamp:.6f},{record.byte_value},"
+        f"{record.anomaly_type or ''},"
+        f"{'' if record.z_score is None else record.z_score},"
+        f"{'' if record.p_value is None else record.p_value},"
+        f"{record.significance or ''}\n"
+    )
+
+
 class BitstreamWriter:
     """Write bitstream data to file."""
 
-    def __init__(self, filepath: Path, metadata: CaptureMetadata):
+    def __init__(
+        self, filepath: Path, metadata: CaptureMetadata, buffer_size: int = 1000
+    ):
         """Initialize writer.
 
         Args:
             filepath: Path to output file
             metadata: Capture metadata
+            buffer_size: Number of records to buffer before writing them out
         """
         self.filepath = filepath
         self.metadata = metadata
+        self.buffer_size = buffer_size
         self.csv_file = None
-        self.csv_writer = None
         self.records_written = 0
+        self._buffer: list[BitstreamRecord] = []
+
+        # Position index: (position, byte offset) every INDEX_INTERVAL rows,
+        # plus the byte offset of every anomaly row
+        self._offset = 0
+        self._rows_flushed = 0
+        self._row_index: list[tuple[int, int]] = []
+        self._anomaly_offsets: list[int] = []
 
     def __enter__(self) -> "BitstreamWriter":
         """Context manager entry."""
-        self.csv_file = open(self.filepath, "w", newline="")
-
-        # Write metadata as JSON comment in first line
-        metadata_json = json.dumps(asdict(self.metadata))
-        self.csv_file.write(f"# {metadata_json}\n")
-
-        # CSV writer for data
-        self.csv_writer = csv.DictWriter(
-            self.csv_file,
-            fieldnames=[
-                "position",
-                "timestamp",
-                "byte_value",
-                "anomaly_type",
-                "z_score",
-                "p_value",
-                "significance",
-            ],
-        )
-        self.csv_writer.writeheader()
+        self.csv_file = self._open_output()
+
+        # Write metadata as JSON comment in first line, then the CSV header.
+        # Everything written is ASCII, so string lengths are byte offsets.
+        metadata_json = json.dumps(self.metadata.to_dict())
+        header = f"# {metadata_json}\n" + ",".join(RECORD_FIELDS) + "\n"
+        self.csv_file.write(header)
+        self._offset = len(header)
 
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         """Context manager exit."""
         if self.csv_file:
+            self._flush_buffer()
             self.csv_file.close()
+            self._write_index()
+
+    def _open_output(self) -> IO[str]:
+        """Open the text stream the CSV rows are written to."""
+        return open(self.filepath, "w", newline="")
 
     def write_record(self, record: BitstreamRecord) -> None:
-        """Write a single record."""
-        if not self.csv_writer:
-            raise RuntimeError("Writer not initialized")
+        """Write a single record.
+
+        Records are buffered and written out in batches of ``buffer_size``.
+        """
+        self._require_open()
 
-        self.csv_writer.writerow(asdict(record))
+        self._buffer.append(record)
         self.records_written += 1
 
-        # Flush periodically for live viewing
-        if self.records_written % 1000 == 0:
-            self.csv_file.flush()
+        if len(self._buffer) >= self.buffer_size:
+            self._flush_buffer()
+
+    def write_records(self, records: Iterable[BitstreamRecord]) -> None:
+        """Write a batch of records."""
+        self._require_open()
+
+        count_before = len(self._buffer)
+        self._buffer.extend(records)
+        self.records_written += len(self._buffer) - count_before
+
+        if len(self._buffer) >= self.buffer_size:
+            self._flush_buffer()
+
+    def write_batch(
+        self,
+        positions: np.ndarray,
+        timestamps: np.ndarray,
+        byte_values: np.ndarray,
+        anomalies: dict[int, tuple[str, float, float, str]] | None = None,
+    ) -> None:
+        """Write a batch of records given as column arrays.
+
+        Args:
+            positions: Stream position of each record
+            timestamps: Capture timestamp of each record
+            byte_values: Byte value of each record
+            anomalies: Optional mapping from index within the batch to
+                (anomaly_type, z_score, p_value, significance)
+        """
+        self._require_open()
+
+        # Keep file order when mixing with write_record
+        self._flush_buffer()
+
+        positions = np.asarray(positions).tolist()
+        timestamps = _format_timestamps(np.asarray(timestamps))
+        byte_values = np.asarray(byte_values).tolist()
+
+        # Most records carry no anomaly, so format them all as clean rows
+        # and patch in the few that do
+        lines = list(map("{},{},{},,,,\n".format, positions, timestamps, byte_values))
+        anomalies = anomalies or {}
+        for i, (anomaly_type, z_score, p_value, significance) in anomalies.items():
+            lines[i] = (
+                f"{positions[i]},{timestamps[i]},{byte_values[i]},"
+                f"{anomaly_type},{z_score},{p_value},{significance}\n"
+            )
+
+        self._write_lines(lines, positions, sorted(anomalies))
+        self.records_written += len(lines)
+
+    def _require_open(self) -> None:
+        """Raise if the writer has not been entered."""
+        if not self.csv_file:
+            raise RuntimeError("Writer not initialized")
+
+    def _flush_buffer(self) -> None:
+        """Format all buffered records and write them with a single call."""
+        if not self._buffer:
+            return
+
+        buffer = self._buffer
+        self._write_lines(
+            list(map(_format_record, buffer)),
+            [record.position for record in buffer],
+            [i for i, record in enumerate(buffer) if record.anomaly_type],
+        )
+        buffer.clear()
+
+    def _write_lines(
+        self, lines: list[str], positions: list[int], anomaly_rows: list[int]
+    ) -> None:
+        """Write formatted rows and record their offsets in the position index.
+
+        Args:
+            lines: Formatted CSV lines
+            positions: Stream position of each line
+            anomaly_rows: Indices of the lines that carry an anomaly
+        """
+        offsets = list(accumulate(map(len, lines), initial=self._offset))
+        first_indexed = -self._rows_flushed % INDEX_INTERVAL
+        for i in range(first_indexed, len(lines), INDEX_INTERVAL):
+            self._row_index.append((positions[i], offsets[i]))
+        self._anomaly_offsets.extend(offsets[i] for i in anomaly_rows)
+
+        self.csv_file.write("".join(lines))
+        self._offset = offsets[-1]
+        self._rows_flushed += len(lines)
+
+        # Flush so the file can be viewed while capturing
+        self.csv_file.flush()
+
+    def _write_index(self) -> None:
+        """Write the position index sidecar used for fast reader queries."""
+        index = {
+            "total_records": self._rows_flushed,
+            "anomaly_count": len(self._anomaly_offsets),
+            "row_index": self._row_index,
+            "anomaly_offsets": self._anomaly_offsets,
+        }
+        with open(_index_path(self.filepath), "w") as f:
+            json.dump(index, f)
+
+
+class ZstdBitstreamWriter(BitstreamWriter):
+    """Write bitstream data as a zstd-compressed CSV stream.
+
+    The CSV content is identical to BitstreamWriter's; it typically
+    compresses 5-10x, which cuts disk traffic when captures are re-read.
+    Each flush ends a zstd block so the file stays readable while
+    capturing. No position index is written, since byte offsets into
+    compressed data cannot be seeked to.
+    """
+
+    def _open_output(self) -> IO[str]:
+        """Open a compressing text stream over the output file."""
+        zstandard = _import_zstandard()
+        compressor = zstandard.ZstdCompressor(level=3, threads=-1)
+        return zstandard.open(
+            self.filepath, "w", cctx=compressor, encoding="ascii", newline=""
+        )
+
+    def _write_index(self) -> None:
+        """Compressed captures have no position index."""
+
+
+def _import_zstandard():
+    """Import zstandard, which is an optional dependency."""
+    try:
+        import zstandard
+    except ImportError as e:
+        raise RuntimeError(
+            "Compressed (.zst) capture files require zstandard: "
+            "pip install 'rng-viz[zstd]'"
+        ) from e
+    return zstandard
+
+
+class ParquetBitstreamWriter(BitstreamWriter):
+    """Write bitstream data to a columnar Parquet file.
+
+    Metadata is stored in the file's key-value metadata instead of a header
+    line, and the anomaly string columns are dictionary encoded. Requires
+    the optional pyarrow dependency.
+    """
+
+    def __init__(
+        self, filepath: Path, metadata: CaptureMetadata, buffer_size: int = 65536
+    ):
+        """Initialize writer.
+
+        Args:
+            filepath: Path to output file
+            metadata: Capture metadata
+            buffer_size: Number of records per Parquet row group
+        """
+        super().__init__(filepath, metadata, buffer_size)
+        self.parquet_writer = None
+
+    def __enter__(self) -> "ParquetBitstreamWriter":
+        """Context manager entry."""
+        pa, pq = _import_pyarrow()
+        schema = _parquet_schema(pa).with_metadata(
+            {b"capture": json.dumps(self.metadata.to_dict()).encode()}
+        )
+        self.parquet_writer = pq.ParquetWriter(
+            self.filepath, schema, compression="zstd"
+        )
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit."""
+        if self.parquet_writer:
+            self._flush_buffer()
+            self.parquet_writer.close()
+
+    def write_batch(
+        self,
+        positions: np.ndarray,
+        timestamps: np.ndarray,
+        byte_values: np.ndarray,
+        anomalies: dict[int, tuple[str, float, float, str]] | None = None,
+    ) -> None:
+        """Write a batch of records given as column arrays.
+
+        Args:
+            positions: Stream position of each record
+            timestamps: Capture timestamp of each record
+            byte_values: Byte value of each record
+            anomalies: Optional mapping from index within the batch to
+                (anomaly_type, z_score, p_value, significance)
+        """
+        self._require_open()
+        self._flush_buffer()
+
+        n = len(positions)
+        optional: list[list] = [[None] * n for _ in range(4)]
+        for i, fields in (anomalies or {}).items():
+            for column, value in zip(optional, fields, strict=True):
+                column[i] = value
+
+        self._write_columns([positions, timestamps, byte_values, *optional])
+        self.records_written += n
+
+    def _require_open(self) -> None:
+        """Raise if the writer has not been entered."""
+        if not self.parquet_writer:
+            raise RuntimeError("Writer not initialized")
+
+    def _flush_buffer(self) -> None:
+        """Write all buffered records as one row group."""
+        if not self._buffer:
+            return
+
+        columns = [
+            [getattr(record, name) for record in self._buffer] for name in RECORD_FIELDS
+        ]
+        self._write_columns(columns)
+        self._buffer.clear()
+
+    def _write_columns(self, columns: list) -> None:
+        """Write one row group from per-field column values."""
+        pa, _ = _import_pyarrow()
+        schema = self.parquet_writer.schema
+        batch = pa.RecordBatch.from_arrays(
+            [
+                pa.array(values, type=field.type)
+                for values, field in zip(columns, schema, strict=True)
+            ],
+            schema=schema,
+        )
+        self.parquet_writer.write_batch(batch)
+
+
+def _import_pyarrow():
+    """Import pyarrow and its Parquet module, which are optional dependencies."""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise RuntimeError(
+            "Parquet capture files require pyarrow: pip install 'rng-viz[parquet]'"
+        ) from e
+    return pa, pq
+
+
+def _parquet_schema(pa):
+    """Arrow schema for Parquet capture files."""
+    anomaly_string = pa.dictionary(pa.int8(), pa.string())
+    return pa.schema(
+        [
+            ("position", pa.int64()),
+            ("timestamp", pa.float64()),
+            ("byte_value", pa.uint8()),
+            ("anomaly_type", anomaly_string),
+            ("z_score", pa.float64()),
+            ("p_value", pa.float64()),
+            ("significance", anomaly_string),
+        ]
+    )
+
+
+class BinaryBitstreamWriter(BitstreamWriter):
+    """Write bitstream data as fixed-size binary records.
+
+    Records use BINARY_RECORD_DTYPE, so the reader loads them with a single
+    NumPy call instead of parsing text. z-scores and p-values are stored as
+    float32.
+    """
+
+    def __init__(
+        self, filepath: Path, metadata: CaptureMetadata, buffer_size: int = 1000
+    ):
+        """Initialize writer.
+
+        Args:
+            filepath: Path to output file
+            metadata: Capture metadata
+            buffer_size: Number of records to buffer before writing them out
+        """
+        super().__init__(filepath, metadata, buffer_size)
+        self.bin_file = None
+
+    def __enter__(self) -> "BinaryBitstreamWriter":
+        """Context manager entry."""
+        self.bin_file = open(self.filepath, "wb")
+        self.bin_file.write(_binary_header(self.metadata))
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit."""
+        if self.bin_file:
+            self._flush_buffer()
+            self.bin_file.close()
+
+    def write_batch(
+        self,
+        positions: np.ndarray,
+        timestamps: np.ndarray,
+        byte_values: np.ndarray,
+        anomalies: dict[int, tuple[str, float, float, str]] | None = None,
+    ) -> None:
+        """Write a batch of records given as column arrays.
+
+        Args:
+            positions: Stream position of each record
+            timestamps: Capture timestamp of each record
+            byte_values: Byte value of each record
+            anomalies: Optional mapping from index within the batch to
+                (anomaly_type, z_score, p_value, significance)
+        """
+        self._require_open()
+        self._flush_buffer()
+
+        records = np.zeros(len(positions), dtype=BINARY_RECORD_DTYPE)
+        records["position"] = positions
+        records["timestamp"] = timestamps
+        records["byte_value"] = byte_values
+        records["z_score"] = np.nan
+        records["p_value"] = np.nan
+        for i, (anomaly_type, z_score, p_value, significance) in (
+            anomalies or {}
+        ).items():
+            records["flags"][i] = _encode_flags(anomaly_type, significance)
+            records["z_score"][i] = z_score
+            records["p_value"][i] = p_value
+
+        self._write_array(records)
+        self.records_written += len(records)
+
+    def _require_open(self) -> None:
+        """Raise if the writer has not been entered."""
+        if not self.bin_file:
+            raise RuntimeError("Writer not initialized")
+
+    def _flush_buffer(self) -> None:
+        """Pack all buffered records and write them with a single call."""
+        if not self._buffer:
+            return
+
+        buffer = self._buffer
+        records = np.zeros(len(buffer), dtype=BINARY_RECORD_DTYPE)
+        records["position"] = [record.position for record in buffer]
+        records["timestamp"] = [record.timestamp for record in buffer]
+        records["byte_value"] = [record.byte_value for record in buffer]
+        records["flags"] = [
+            _encode_flags(record.anomaly_type, record.significance) for record in buffer
+        ]
+        records["z_score"] = [
+            np.nan if record.z_score is None else record.z_score for record in buffer
+        ]
+        records["p_value"] = [
+            np.nan if record.p_value is None else record.p_value for record in buffer
+        ]
+        self._write_array(records)
+        buffer.clear()
+
+    def _write_array(self, records: np.ndarray) -> None:
+        """Write packed records and flush so the file can be read while capturing."""
+        # The file reads the array's buffer directly, without a bytes copy
+        self.bin_file.write(records.data)
+        self.bin_file.flush()
+
+
+def _binary_header(metadata: CaptureMetadata) -> bytes:
+    """Build the header of a binary capture file."""
+    metadata_json = json.dumps(metadata.to_dict()).encode()
+    header = BINARY_MAGIC + struct.pack("<I", len(metadata_json)) + metadata_json
+    return header + b"\0" * (-len(header) % 8)
+
+
+def _read_binary_header(f: IO[bytes]) -> tuple[dict[str, Any], int]:
+    """Read the header of a binary capture file.
+
+    Returns:
+        Metadata dictionary and the byte offset of the first record
+    """
+    prefix = f.read(len(BINARY_MAGIC) + 4)
+    if not prefix.startswith(BINARY_MAGIC) or len(prefix) < len(BINARY_MAGIC) + 4:
+        raise ValueError("File is not a binary capture file")
+
+    (length,) = struct.unpack("<I", prefix[len(BINARY_MAGIC) :])
+    metadata_dict = json.loads(f.read(length))
+    header_size = len(prefix) + length
+    return metadata_dict, header_size + (-header_size % 8)
+
+
+def _encode_flags(anomaly_type: str | None, significance: str | None) -> int:
+    """Pack an anomaly type and significance level into a flags byte."""
+    try:
+        return _ANOMALY_TYPES.index(anomaly_type) | (
+            _SIGNIFICANCE_LEVELS.index(significance or None) << SIGNIFICANCE_SHIFT
+        )
+    except ValueError as e:
+        raise ValueError(
+            f"Cannot store anomaly {anomaly_type!r} ({significance!r}) "
+            "in a binary capture"
+        ) from e
+
+
+def _binary_columns(records: np.ndarray) -> dict[str, np.ndarray]:
+    """Decode binary records into one array per record field.
+
+    Matches the columns of the CSV/Parquet paths: missing strings are None
+    and missing numbers NaN.
+    """
+    flags = records["flags"]
+    return {
+        "position": records["position"],
+        "timestamp": records["timestamp"],
+        "byte_value": records["byte_value"],
+        "anomaly_type": np.array(_ANOMALY_TYPES, dtype=object)[flags & ANOMALY_MASK],
+        "z_score": records["z_score"].astype(np.float64),
+        "p_value": records["p_value"].astype(np.float64),
+        "significance": np.array(_SIGNIFICANCE_LEVELS, dtype=object)[
+            flags >> SIGNIFICANCE_SHIFT & 0b11
+        ],
+    }
+
+
+def create_writer(filepath: Path, metadata: CaptureMetadata) -> BitstreamWriter:
+    """Create a writer for the capture format implied by the file extension.
+
+    Args:
+        filepath: Path to output file (``.parquet`` for Parquet, ``.zst`` for
+            zstd-compressed CSV, ``.rngbin`` for binary records, otherwise CSV)
+        metadata: Capture metadata
+
+    Returns:
+        Writer instance (not yet entered)
+    """
+    if filepath.suffix == ".parquet":
+        return ParquetBitstreamWriter(filepath, metadata)
+    if filepath.suffix == ".zst":
+        return ZstdBitstreamWriter(filepath, metadata)
+    if filepath.suffix == ".rngbin":
+        return BinaryBitstreamWriter(filepath, metadata)
+    return BitstreamWriter(filepath, metadata)
 
 
 class BitstreamReader:
@@ -110,14 +699,60 @@ class BitstreamReader:
         """
         self.filepath = filepath
         self.metadata: CaptureMetadata | None = None
+        self.is_parquet = filepath.suffix == ".parquet"
+        self.is_binary = filepath.suffix == ".rngbin"
+        # Position index sidecar, keyed by the capture's mtime like _df
+        self._index: dict[str, Any] | None = None
+        self._index_mtime_ns: int | None = None
+
+        # Parsed DataFrame shared by the whole-file queries, keyed by the
+        # file's mtime so a capture that is still growing gets re-read
+        self._df: pd.DataFrame | None = None
+        self._df_mtime_ns: int | None = None
+
+    def __enter__(self) -> "BitstreamReader":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit."""
+        self.close()
+
+    def close(self) -> None:
+        """Release cached file contents."""
+        self._df = None
+        self._df_mtime_ns = None
+        self._index = None
+        self._index_mtime_ns = None
 
     def load_metadata(self) -> CaptureMetadata:
         """Load metadata from file.
 
+        The header never changes once written, so it is only read once.
+
         Returns:
             Capture metadata
         """
-        with open(self.filepath) as f:
+        if self.metadata is not None:
+            return self.metadata
+
+        if self.is_parquet:
+            _, pq = _import_pyarrow()
+            schema_metadata = pq.read_schema(self.filepath).metadata or {}
+            if b"capture" not in schema_metadata:
+                raise ValueError("File does not contain capture metadata")
+            metadata_dict = json.loads(schema_metadata[b"capture"])
+            self.metadata = CaptureMetadata.from_dict(metadata_dict)
+            return self.metadata
+
+        if self.is_binary:
+            with open(self.filepath, "rb") as f:
+                metadata_dict, _ = _read_binary_header(f)
+            self.metadata = CaptureMetadata.from_dict(metadata_dict)
+            return self.metadata
+
+        # For .zst files this only decompresses the first block
+        with _open_capture(self.filepath) as f:
             first_line = f.readline().strip()
 
         if not first_line.startswith("# "):
@@ -129,38 +764,181 @@ class BitstreamReader:
 
         return self.metadata
 
+    def iter_rows(self) -> Iterator[Row]:
+        """Iterate over all records in file as plain tuples.
+
+        Cheaper than iter_records for callers that only need the values.
+
+        Yields:
+            (position, timestamp, byte_value, anomaly_type, z_score,
+            p_value, significance) tuples, with None for missing fields
+        """
+        if self.is_parquet:
+            yield from self._iter_parquet_rows()
+            return
+        if self.is_binary:
+            yield from self._iter_binary_rows()
+            return
+
+        # Binary mode: the data section is plain ASCII, so rows are split
+        # as bytes and int()/float() parse the fields without decoding
+        with _open_for_scan(self.filepath, "rb") as f:
+            f.readline()  # Metadata line
+            f.readline()  # Column header, always RECORD_FIELDS
+            for line in f:
+                (
+                    position,
+                    timestamp,
+                    byte_value,
+                    anomaly_type,
+                    z_score,
+                    p_value,
+                    significance,
+                ) = line.rstrip(b"\r\n").split(b",")
+                yield (
+                    int(position),
+                    float(timestamp),
+                    int(byte_value),
+                    anomaly_type.decode() if anomaly_type else None,
+                    float(z_score) if z_score else None,
+                    float(p_value) if p_value else None,
+                    significance.decode() if significance else None,
+                )
+
     def iter_records(self) -> Iterator[BitstreamRecord]:
         """Iterate over all records in file.
 
         Yields:
             BitstreamRecord objects
         """
-        with open(self.filepath) as f:
-            # Skip metadata line
-            f.readline()
-
-            csv_reader = csv.DictReader(f)
-            for row in csv_reader:
-                # Convert numeric fields
-                position = int(row["position"])
-                timestamp = float(row["timestamp"])
-                byte_value = int(row["byte_value"])
-
-                # Handle optional fields
-                anomaly_type = row["anomaly_type"] if row["anomaly_type"] else None
-                z_score = float(row["z_score"]) if row["z_score"] else None
-                p_value = float(row["p_value"]) if row["p_value"] else None
-                significance = row["significance"] if row["significance"] else None
-
-                yield BitstreamRecord(
-                    position=position,
-                    timestamp=timestamp,
-                    byte_value=byte_value,
-                    anomaly_type=anomaly_type,
-                    z_score=z_score,
-                    p_value=p_value,
-                    significance=significance,
-                )
+        return starmap(BitstreamRecord, self.iter_rows())
+
+    def iter_column_batches(
+        self, batch_size: int = 65536
+    ) -> Iterator[dict[str, np.ndarray]]:
+        """Iterate over the records in batches, as one NumPy array per field.
+
+        Streams the file like iter_rows, so callers can process each batch
+        with array operations without loading the whole file.
+
+        Args:
+            batch_size: Maximum number of records per batch
+
+        Yields:
+            Mapping of field name to array for each batch of records, with
+            the dtypes of load_columns; missing strings are None and missing
+            numbers NaN
+        """
+        if self.is_parquet:
+            _, pq = _import_pyarrow()
+            parquet_file = pq.ParquetFile(self.filepath)
+            for batch in parquet_file.iter_batches(batch_size=batch_size):
+                yield {
+                    name: batch.column(name).to_numpy(zero_copy_only=False)
+                    for name in RECORD_FIELDS
+                }
+            return
+        if self.is_binary:
+            yield from map(_binary_columns, self._iter_binary_blocks(batch_size))
+            return
+
+        batch: list[Row] = []
+        try:
+            for row in self.iter_rows():
+                batch.append(row)
+                if len(batch) == batch_size:
+                    yield _rows_to_columns(batch)
+                    batch = []
+        except Exception:
+            # Yield the records read before a bad one, then fail
+            if batch:
+                yield _rows_to_columns(batch)
+            raise
+        if batch:
+            yield _rows_to_columns(batch)
+
+    def load_index(self) -> dict[str, Any] | None:
+        """Load the position index sidecar written alongside CSV captures.
+
+        Returns:
+            Index dictionary, or None if there is no up-to-date index (e.g.
+            the capture is still being written or came from an older version)
+        """
+        if self.is_binary or self.filepath.suffix == ".zst":
+            return None
+
+        index_path = _index_path(self.filepath)
+        try:
+            mtime_ns = self.filepath.stat().st_mtime_ns
+            if self._index is not None and self._index_mtime_ns == mtime_ns:
+                return self._index
+
+            # The capture changed since the index was loaded, if it ever was
+            self._index = None
+            if index_path.stat().st_mtime_ns < mtime_ns:
+                return None
+            with open(index_path) as f:
+                self._index = json.load(f)
+            self._index_mtime_ns = mtime_ns
+        except (FileNotFoundError, ValueError):
+            return None
+
+        return self._index
+
+    def _read_lines_at(self, offsets: Iterable[int]) -> list[BitstreamRecord]:
+        """Parse the single data lines starting at the given byte offsets."""
+        records = []
+        with open(self.filepath, "rb") as f:
+            for offset in offsets:
+                f.seek(offset)
+                records.append(_parse_line(f.readline()))
+        return records
+
+    def _iter_parquet_rows(self) -> Iterator[Row]:
+        """Iterate over the rows of a Parquet file one batch at a time."""
+        _, pq = _import_pyarrow()
+        parquet_file = pq.ParquetFile(self.filepath)
+        for batch in parquet_file.iter_batches(batch_size=65536):
+            columns = batch.to_pydict()
+            yield from zip(*(columns[name] for name in RECORD_FIELDS), strict=True)
+
+    def load_dataframe(self) -> "pd.DataFrame":
+        """Load all records into a DataFrame using pandas' C parser.
+
+        Returns:
+            DataFrame with one column per record field; missing optional
+            fields are NaN
+        """
+        import pandas as pd
+
+        if self.is_parquet:
+            return pd.read_parquet(self.filepath)
+        if self.is_binary:
+            return pd.DataFrame(_binary_columns(self.load_array()))
+
+        return pd.read_csv(self.filepath, skiprows=1, dtype=_CSV_DTYPES, engine="c")
+
+    def _cached_dataframe(self) -> "pd.DataFrame":
+        """Get the parsed records, re-parsing only if the file changed."""
+        mtime_ns = self.filepath.stat().st_mtime_ns
+        if self._df is None or self._df_mtime_ns != mtime_ns:
+            self._df = self.load_dataframe()
+            self._df_mtime_ns = mtime_ns
+        return self._df
+
+    def load_columns(self) -> dict[str, np.ndarray]:
+        """Load all records as one NumPy array per field.
+
+        Avoids building a BitstreamRecord per row, for callers that work
+        on whole columns (plotting, re-analysis).
+
+        Returns:
+            Mapping of field name to array; position is int64, timestamp,
+            z_score and p_value are float64 (NaN where missing),
+            byte_value is uint8 and the string fields are object arrays
+        """
+        df = self._cached_dataframe()
+        return {name: df[name].to_numpy() for name in RECORD_FIELDS}
 
     def load_all_records(self) -> list[BitstreamRecord]:
         """Load all records into memory.
@@ -168,7 +946,54 @@ class BitstreamReader:
         Returns:
             List of all records
         """
-        return list(self.iter_records())
+        return _frame_to_records(self._cached_dataframe())
+
+    def _iter_binary_rows(self) -> Iterator[Row]:
+        """Iterate over the rows of a binary file one block at a time."""
+        for records in self._iter_binary_blocks(65536):
+            yield from _columns_to_rows(_binary_columns(records))
+
+    def _iter_binary_blocks(self, block_records: int) -> Iterator[np.ndarray]:
+        """Read the records of a binary file up to ``block_records`` at a time."""
+        block_size = block_records * BINARY_RECORD_DTYPE.itemsize
+        with _open_for_scan(self.filepath, "rb") as f:
+            _, header_size = _read_binary_header(f)
+            f.seek(header_size)
+            while True:
+                data = f.read(block_size)
+                # Ignore a partially written trailing record
+                data = data[: len(data) - len(data) % BINARY_RECORD_DTYPE.itemsize]
+                if not data:
+                    break
+                yield np.frombuffer(data, dtype=BINARY_RECORD_DTYPE)
+
+    def load_array(self) -> np.ndarray:
+        """Memory-map the records of a binary capture file.
+
+        Pages are read lazily by the OS, so this is cheap even for captures
+        larger than memory, and slicing gives O(1) random access.
+
+        Returns:
+            Read-only structured array with dtype BINARY_RECORD_DTYPE
+        """
+        if not self.is_binary:
+            raise ValueError("load_array is only supported for .rngbin files")
+
+        with open(self.filepath, "rb") as f:
+            _, header_size = _read_binary_header(f)
+        # Ignore a partially written trailing record
+        count = (
+            self.filepath.stat().st_size - header_size
+        ) // BINARY_RECORD_DTYPE.itemsize
+        if count == 0:
+            return np.empty(0, dtype=BINARY_RECORD_DTYPE)
+        return np.memmap(
+            self.filepath,
+            dtype=BINARY_RECORD_DTYPE,
+            mode="r",
+            offset=header_size,
+            shape=(count,),
+        )
 
     def get_records_range(self, start: int, end: int) -> list[BitstreamRecord]:
         """Get records within a position range.
@@ -180,12 +1005,49 @@ class BitstreamReader:
         Returns:
             List of records in range
         """
+        if self.is_parquet:
+            import pandas as pd
+
+            # Push the range down so non-matching row groups are never read
+            df = pd.read_parquet(
+                self.filepath,
+                filters=[("position", ">=", start), ("position", "<", end)],
+            )
+            return _frame_to_records(df)
+
+        if self.is_binary:
+            records = self.load_array()
+            positions = records["position"]
+            lo, hi = np.searchsorted(positions, [start, end])
+            return _columns_to_records(_binary_columns(records[lo:hi]))
+
+        index = self.load_index()
+        if index is not None:
+            return self._read_range_indexed(index, start, end)
+
+        df = self._cached_dataframe()
+        return _frame_to_records(df[(df["position"] >= start) & (df["position"] < end)])
+
+    def _read_range_indexed(
+        self, index: dict[str, Any], start: int, end: int
+    ) -> list[BitstreamRecord]:
+        """Seek to the nearest indexed row before ``start`` and parse forward."""
+        row_index = index["row_index"]
+        if not row_index:
+            return []
+
+        indexed_positions = [position for position, _ in row_index]
+        entry = max(bisect.bisect_right(indexed_positions, start) - 1, 0)
+
         records = []
-        for record in self.iter_records():
-            if start <= record.position < end:
-                records.append(record)
-            elif record.position >= end:
-                break
+        with _open_for_scan(self.filepath, "rb") as f:
+            f.seek(row_index[entry][1])
+            for line in f:
+                record = _parse_line(line)
+                if record.position >= end:
+                    break
+                if record.position >= start:
+                    records.append(record)
 
         return records
 
@@ -195,7 +1057,73 @@ class BitstreamReader:
         Returns:
             List of anomaly records
         """
-        return [record for record in self.iter_records() if record.anomaly_type]
+        if self.is_parquet:
+            import pandas as pd
+
+            _import_pyarrow()
+            import pyarrow.compute as pc
+
+            # Filter inside Arrow so clean rows are never converted
+            df = pd.read_parquet(
+                self.filepath, filters=pc.field("anomaly_type").is_valid()
+            )
+            return _frame_to_records(df)
+
+        if self.is_binary:
+            records = self.load_array()
+            anomalous = records[(records["flags"] & ANOMALY_MASK) != 0]
+            return _columns_to_records(_binary_columns(anomalous))
+
+        index = self.load_index()
+        if index is not None:
+            return self._read_lines_at(index["anomaly_offsets"])
+
+        df = self._cached_dataframe()
+        return _frame_to_records(df[df["anomaly_type"].notna()])
+
+    def _count_parquet_rows(self) -> tuple[int, int]:
+        """Count records and anomalies from the Parquet footer statistics."""
+        _, pq = _import_pyarrow()
+        footer = pq.ParquetFile(self.filepath).metadata
+        column = RECORD_FIELDS.index("anomaly_type")
+
+        null_count = 0
+        for i in range(footer.num_row_groups):
+            stats = footer.row_group(i).column(column).statistics
+            if stats is None or not stats.has_null_count:
+                # Written without statistics; count from the data instead
+                df = self._cached_dataframe()
+                return len(df), int(df["anomaly_type"].notna().sum())
+            null_count += stats.null_count
+
+        return footer.num_rows, footer.num_rows - null_count
+
+    def _count_csv_rows(self) -> tuple[int, int]:
+        """Count records and anomalies by scanning the raw CSV bytes.
+
+        Every row ends in a newline and rows without an anomaly end in
+        four empty fields, so both counts come from bytes.count without
+        parsing any values. Captures written by csv.DictWriter end their
+        rows in CRLF, so both line endings are matched.
+        """
+        clean_row_ends = (b",,,,\n", b",,,,\r\n")
+        overlap = max(map(len, clean_row_ends)) - 1
+        newlines = clean_rows = 0
+        tail = b""
+        with _open_for_scan(self.filepath, "rb") as f:
+            for data in iter(lambda: f.read(SCAN_BUFFER_SIZE), b""):
+                newlines += data.count(b"\n")
+                for clean_row_end in clean_row_ends:
+                    clean_rows += data.count(clean_row_end)
+                    # Matches split across the chunk boundary
+                    n = len(clean_row_end) - 1
+                    clean_rows += (tail[-n:] + data[:n]).count(clean_row_end)
+                tail = data[-overlap:]
+
+        # Skip the metadata and column header lines; an unterminated final
+        # line is a row still being written and is not counted
+        total_records = max(newlines - 2, 0)
+        return total_records, total_records - clean_rows
 
     def get_file_stats(self) -> dict[str, Any]:
         """Get statistics about the file.
@@ -203,26 +1131,70 @@ class BitstreamReader:
         Returns:
             Dictionary with file statistics
         """
-        if not self.metadata:
-            self.load_metadata()
+        self.load_metadata()
 
-        total_records = 0
-        anomaly_count = 0
-
-        for record in self.iter_records():
-            total_records += 1
-            if record.anomaly_type:
-                anomaly_count += 1
+        if self.is_binary:
+            records = self.load_array()
+            total_records = len(records)
+            anomaly_count = int(np.count_nonzero(records["flags"] & ANOMALY_MASK))
+        elif self.is_parquet:
+            total_records, anomaly_count = self._count_parquet_rows()
+        elif (index := self.load_index()) is not None:
+            total_records = index["total_records"]
+            anomaly_count = index["anomaly_count"]
+        else:
+            total_records, anomaly_count = self._count_csv_rows()
 
         return {
             "filepath": str(self.filepath),
             "total_records": total_records,
             "anomaly_count": anomaly_count,
             "anomaly_rate": anomaly_count / total_records if total_records > 0 else 0,
-            "metadata": asdict(self.metadata) if self.metadata else None,
+            "metadata": self.metadata.to_dict() if self.metadata else None,
         }
 
 
+def _frame_to_records(df: "pd.DataFrame") -> list[BitstreamRecord]:
+    """Convert a records DataFrame to BitstreamRecords, mapping NaN to None."""
+    columns = []
+    for name in RECORD_FIELDS:
+        column = df[name]
+        if column.hasnans:
+            column = column.astype(object).where(column.notna(), None)
+        columns.append(column.tolist())
+    return [BitstreamRecord(*values) for values in zip(*columns, strict=True)]
+
+
+def _columns_to_rows(columns: dict[str, np.ndarray]) -> Iterator[Row]:
+    """Convert per-field arrays to row tuples, mapping NaN to None."""
+    values = []
+    for name in RECORD_FIELDS:
+        column = columns[name]
+        if column.dtype.kind == "f" and np.isnan(column).any():
+            column = np.where(np.isnan(column), None, column)
+        values.append(column.tolist())
+    return zip(*values, strict=True)
+
+
+def _rows_to_columns(rows: list[Row]) -> dict[str, np.ndarray]:
+    """Convert row tuples to per-field arrays, mapping None to NaN in numbers."""
+    columns = dict(zip(RECORD_FIELDS, zip(*rows, strict=True), strict=True))
+    return {
+        "position": np.array(columns["position"], dtype=np.int64),
+        "timestamp": np.array(columns["timestamp"], dtype=np.float64),
+        "byte_value": np.array(columns["byte_value"], dtype=np.uint8),
+        "anomaly_type": np.array(columns["anomaly_type"], dtype=object),
+        "z_score": np.array(columns["z_score"], dtype=np.float64),
+        "p_value": np.array(columns["p_value"], dtype=np.float64),
+        "significance": np.array(columns["significance"], dtype=object),
+    }
+
+
+def _columns_to_records(columns: dict[str, np.ndarray]) -> list[BitstreamRecord]:
+    """Convert per-field arrays to BitstreamRecords, mapping NaN to None."""
+    return list(starmap(BitstreamRecord, _columns_to_rows(columns)))
+
+
 def create_capture_metadata(
     device_info: dict[str, Any], window_size: int, sensitivity: float
 ) -> CaptureMetadata:
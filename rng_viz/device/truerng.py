@@ -1,5 +1,10 @@
 """TrueRNG Pro V2 device interface."""
 
+import os
+import queue
+import re
+import selectors
+import threading
 import time
 from collections.abc import Generator
 from dataclasses import dataclass
@@ -32,6 +37,23 @@ class DeviceInfo:
     pid: int | None = None
 
 
+# Port descriptions that suggest a TrueRNG (CDC ACM) device
+_PORT_KEYWORDS = re.compile("cdc|acm|truerng|random", re.IGNORECASE)
+
+
+def _make_selector(conn: serial.Serial) -> selectors.BaseSelector | None:
+    """Create a read selector for the port, or None if it has no fd."""
+    try:
+        fd = conn.fileno()
+    except (AttributeError, OSError, ValueError):
+        # Windows ports have no selectable file descriptor
+        return None
+
+    selector = selectors.DefaultSelector()
+    selector.register(fd, selectors.EVENT_READ)
+    return selector
+
+
 class TrueRNGDevice:
     """Interface for TrueRNG Pro V2 random number generator."""
 
@@ -39,6 +61,14 @@ class TrueRNGDevice:
     TRUERNG_VID = 0x04D8  # Microchip VID
     TRUERNG_PID = 0x0009  # Common PID for CDC devices
 
+    # Largest read issued in one call; big reads keep syscalls per byte low
+    CHUNK_SIZE = 64 * 1024
+    # Requested driver receive buffer (only honoured on Windows)
+    RX_BUFFER_SIZE = 1 << 20
+
+    # Result of the last successful find_devices scan
+    _device_cache: list[DeviceInfo] | None = None
+
     def __init__(self, port: str | None = None, mode: TrueRNGMode = TrueRNGMode.NORMAL):
         """Initialize TrueRNG device connection.
 
@@ -51,22 +81,37 @@ class TrueRNGDevice:
         self.serial_conn: serial.Serial | None = None
         self.is_connected = False
 
+        # Background reader state (see start_streaming)
+        self._chunks: queue.SimpleQueue[bytes | BaseException] | None = None
+        self._reader_thread: threading.Thread | None = None
+        self._stop_reading = threading.Event()
+        self._selector: selectors.BaseSelector | None = None
+        self._wakeup: tuple[int, int] | None = None
+        # Serializes teardown, which the consumer and the app may both start
+        self._teardown_lock = threading.RLock()
+
     @classmethod
-    def find_devices(cls) -> list[DeviceInfo]:
+    def find_devices(cls, force: bool = False) -> list[DeviceInfo]:
         """Find all potential TrueRNG devices.
 
+        A non-empty result is cached for later calls (e.g. reconnects);
+        pass force=True to rescan after plugging devices in or out.
+
+        Args:
+            force: Ignore any cached result and rescan
+
         Returns:
             List of detected device information
         """
+        if cls._device_cache is not None and not force:
+            return list(cls._device_cache)
+
         devices = []
         ports = serial.tools.list_ports.comports()
 
         for port in ports:
             # Look for CDC ACM devices (common for TrueRNG)
-            if any(
-                keyword in port.description.lower()
-                for keyword in ["cdc", "acm", "truerng", "random"]
-            ):
+            if _PORT_KEYWORDS.search(port.description):
                 devices.append(
                     DeviceInfo(
                         port=port.device,
@@ -77,14 +122,21 @@ class TrueRNGDevice:
                 )
 
         # Fallback: try common device paths on Linux
-        common_paths = ["/dev/ttyACM0", "/dev/ttyACM1", "/dev/ttyUSB0", "/dev/ttyUSB1"]
-        for path in common_paths:
-            if Path(path).exists() and not any(d.port == path for d in devices):
-                devices.append(
-                    DeviceInfo(port=path, description="Potential TrueRNG device")
-                )
+        if not devices:
+            common_paths = [
+                "/dev/ttyACM0",
+                "/dev/ttyACM1",
+                "/dev/ttyUSB0",
+                "/dev/ttyUSB1",
+            ]
+            for path in common_paths:
+                if Path(path).exists():
+                    devices.append(
+                        DeviceInfo(port=path, description="Potential TrueRNG device")
+                    )
 
-        return devices
+        cls._device_cache = devices or None
+        return list(devices)
 
     def connect(self, port: str | None = None) -> bool:
         """Connect to TrueRNG device.
@@ -98,13 +150,36 @@ class TrueRNGDevice:
         if port:
             self.port = port
 
-        if not self.port:
-            # Auto-detect
-            devices = self.find_devices()
-            if not devices:
-                raise ConnectionError("No TrueRNG devices found")
-            self.port = devices[0].port
+        if self.port:
+            return self._open_port()
+
+        # Auto-detect
+        cached = self._device_cache is not None
+        devices = self.find_devices()
+        if not devices:
+            raise ConnectionError("No TrueRNG devices found")
+        self.port = devices[0].port
+        if not cached:
+            return self._open_port()
+        try:
+            if self._open_port():
+                return True
+        except ConnectionError:
+            pass
 
+        # The cached port may be stale (device unplugged or renumbered)
+        devices = self.find_devices(force=True)
+        if not devices:
+            raise ConnectionError("No TrueRNG devices found")
+        self.port = devices[0].port
+        return self._open_port()
+
+    def _open_port(self) -> bool:
+        """Open self.port and check that it produces data.
+
+        Returns:
+            True if connection successful
+        """
         try:
             # TrueRNG Pro V2 typically uses these settings
             self.serial_conn = serial.Serial(
@@ -116,13 +191,20 @@ class TrueRNGDevice:
                 stopbits=serial.STOPBITS_ONE,
             )
 
+            if hasattr(self.serial_conn, "set_buffer_size"):
+                self.serial_conn.set_buffer_size(rx_size=self.RX_BUFFER_SIZE)
+
             # Give device time to initialize
             time.sleep(0.1)
 
+            # Drop anything queued before we opened the port
+            self.serial_conn.reset_input_buffer()
+
             # Test connection by reading a small amount of data
             test_data = self.serial_conn.read(10)
             if len(test_data) > 0:
                 self.is_connected = True
+                self._selector = _make_selector(self.serial_conn)
                 return True
             else:
                 self.serial_conn.close()
@@ -135,15 +217,24 @@ class TrueRNGDevice:
 
     def disconnect(self) -> None:
         """Disconnect from device."""
-        if self.serial_conn and self.serial_conn.is_open:
-            self.serial_conn.close()
-        self.is_connected = False
+        with self._teardown_lock:
+            self.stop_streaming()
+            if self._selector is not None:
+                self._selector.close()
+                self._selector = None
+            if self.serial_conn and self.serial_conn.is_open:
+                self.serial_conn.close()
+            self.is_connected = False
 
-    def read_bytes(self, num_bytes: int = 1024) -> bytes:
+    def read_bytes(self, num_bytes: int = CHUNK_SIZE) -> bytes:
         """Read raw bytes from device.
 
+        Returns whatever is already buffered, up to num_bytes. If nothing
+        is buffered, blocks only until the first byte arrives instead of
+        waiting out the read timeout for a full chunk.
+
         Args:
-            num_bytes: Number of bytes to read
+            num_bytes: Maximum number of bytes to read
 
         Returns:
             Raw bytes from device
@@ -151,13 +242,115 @@ class TrueRNGDevice:
         if not self.is_connected or not self.serial_conn:
             raise RuntimeError("Device not connected")
 
-        return self.serial_conn.read(num_bytes)
+        conn = self.serial_conn
+        if not conn.in_waiting:
+            # Block for the first byte only, then take whatever followed it
+            data = conn.read(1)
+            if not data:
+                return data
+            return data + conn.read(min(conn.in_waiting, num_bytes - 1))
+
+        return conn.read(min(conn.in_waiting, num_bytes))
+
+    def start_streaming(self, chunk_size: int = CHUNK_SIZE) -> None:
+        """Start reading from the device on a background thread.
+
+        Serial I/O then overlaps with whatever the consumer of
+        stream_bytes is doing, and each read drains everything the
+        driver has buffered instead of a fixed-size slice.
+
+        Args:
+            chunk_size: Maximum number of bytes per read
+        """
+        if not self.is_connected or not self.serial_conn:
+            raise RuntimeError("Device not connected")
+        if self._reader_thread is not None:
+            return
+
+        self._chunks = queue.SimpleQueue()
+        self._stop_reading.clear()
+        if self._selector is not None:
+            # Self-pipe so stop_streaming can wake a reader blocked in select
+            self._wakeup = os.pipe()
+            self._selector.register(self._wakeup[0], selectors.EVENT_READ)
+        self._reader_thread = threading.Thread(
+            target=self._read_loop,
+            args=(self.serial_conn, self._selector, self._chunks, chunk_size),
+            name="truerng-reader",
+            daemon=True,
+        )
+        self._reader_thread.start()
+
+    def stop_streaming(self) -> None:
+        """Stop the background reader thread, if running."""
+        with self._teardown_lock:
+            thread = self._reader_thread
+            if thread is None:
+                return
+
+            self._stop_reading.set()
+            if self._wakeup is not None:
+                os.write(self._wakeup[1], b"\0")
+            if thread is not threading.current_thread():
+                thread.join()
+            if self._wakeup is not None:
+                if self._selector is not None:
+                    self._selector.unregister(self._wakeup[0])
+                for fd in self._wakeup:
+                    os.close(fd)
+                self._wakeup = None
+            self._reader_thread = None
+            self._chunks = None
+
+    def _read_loop(
+        self,
+        conn: serial.Serial,
+        selector: selectors.BaseSelector | None,
+        chunks: "queue.SimpleQueue[bytes | BaseException]",
+        chunk_size: int,
+    ) -> None:
+        """Background thread body: move serial data into the chunk queue.
+
+        Where the port exposes a file descriptor the thread sleeps in the
+        selector until the kernel has data (or stop_streaming wakes it),
+        then drains it with a single os.read, so an idle device costs no
+        wakeups at all and each chunk is the bytes object the kernel copy
+        produced, with no intermediate buffer. Otherwise it relies on
+        pyserial's blocking read. An empty chunk is queued when the thread
+        exits.
+        """
+        try:
+            while not self._stop_reading.is_set():
+                if selector is not None:
+                    selector.select()
+                    if self._stop_reading.is_set():
+                        break
+                    try:
+                        chunk = os.read(conn.fileno(), chunk_size)
+                    except BlockingIOError:
+                        continue  # Spurious wakeup; the port is non-blocking
+                    if not chunk:
+                        raise serial.SerialException(
+                            "device reports readiness to read but returned no "
+                            "data (device disconnected?)"
+                        )
+                else:
+                    # Drain what is buffered; with nothing waiting, block in
+                    # read() for the first byte instead
+                    chunk = conn.read(min(conn.in_waiting, chunk_size) or 1)
+                if chunk:
+                    chunks.put(chunk)
+        except Exception as e:
+            # Hand the failure to the consumer rather than dying silently
+            chunks.put(e)
+        finally:
+            chunks.put(b"")
 
-    def stream_bytes(self, chunk_size: int = 1024) -> Generator[bytes]:
+    def stream_bytes(self, chunk_size: int = CHUNK_SIZE) -> Generator[bytes]:
         """Stream bytes from device.
 
         Args:
-            chunk_size: Size of each chunk to read
+            chunk_size: Maximum size of each chunk
 
         Yields:
             Chunks of raw bytes
@@ -165,14 +358,19 @@ class TrueRNGDevice:
         if not self.is_connected:
             raise RuntimeError("Device not connected")
 
+        self.start_streaming(chunk_size)
+        chunks = self._chunks
+        assert chunks is not None
+
         try:
             while self.is_connected:
-                chunk = self.read_bytes(chunk_size)
-                if chunk:
-                    yield chunk
-                else:
-                    # No data available, small delay to prevent busy waiting
-                    time.sleep(0.001)
+                # Blocks until data arrives or the reader thread exits
+                chunk = chunks.get()
+                if isinstance(chunk, BaseException):
+                    raise chunk
+                if not chunk:
+                    break
+                yield chunk
         except KeyboardInterrupt:
             pass
         finally:
@@ -4,11 +4,19 @@ import asyncio
 import random
 import signal
 import sys
+import threading
 import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Iterator, Sequence
 from dataclasses import dataclass, field
+from functools import cache
 from pathlib import Path
+from queue import Queue
+from typing import Any
 
+import numpy as np
 from rich.panel import Panel
+from rich.text import Text
 from textual.app import App, ComposeResult
 from textual.containers import Container, Vertical
 from textual.widgets import Footer, Header, Label, Static
@@ -16,35 +24,321 @@ from textual.widgets import Footer, Header, Label, Static
 from ..analysis.stats import AnomalyResult, RandomnessAnalyzer
 from ..data.storage import (
     BitstreamReader,
-    BitstreamRecord,
     BitstreamWriter,
     create_capture_metadata,
+    create_writer,
 )
 from ..device.truerng import TrueRNGDevice
 
+# Byte values map linearly onto the visualizer's -1 to 1 range
+_BYTE_MIDPOINT = 127.5
+_BYTE_SCALE = 1 / _BYTE_MIDPOINT
+
+
+def _anomaly_viz_value(z_score: float) -> float:
+    """Visualization value of an anomaly: its z-score / 5, clamped to -1..1."""
+    value = z_score / 5.0
+    return value if -1.0 <= value <= 1.0 else (1.0 if value > 0 else -1.0)
+
+
+def _record_viz_values(byte_values: np.ndarray, z_scores: np.ndarray) -> list[float]:
+    """Visualization values for a batch of recorded bytes.
+
+    Records carrying an anomaly are drawn at its z-score / 5, clamped to -1..1,
+    and the rest at their byte value, as in _viz_samples.
+
+    Args:
+        byte_values: Recorded byte values
+        z_scores: Recorded anomaly z-scores, NaN where there is none
+    """
+    byte_part = (byte_values - _BYTE_MIDPOINT) * _BYTE_SCALE
+    anomaly_part = np.clip(z_scores / 5.0, -1.0, 1.0)
+    return np.where(np.isnan(z_scores), byte_part, anomaly_part).tolist()
+
+
+def _viz_samples(
+    data: np.ndarray,
+    samples: range,
+    first_position: int,
+    anomalies: list[AnomalyResult],
+) -> tuple[list[float], list[str | None]]:
+    """Visualization values and anomaly markers for the sampled bytes of a chunk.
+
+    Bytes map to the range -1 to 1; a byte flagged as anomalous is drawn at
+    its strongest anomaly's z-score / 5 instead, clamped to the same range.
+    Anomalies on bytes that are not drawn are skipped without comparison.
+
+    Args:
+        data: Chunk byte values
+        samples: Indices within the chunk to visualize
+        first_position: Stream position of the chunk's first byte
+        anomalies: Anomalies found in the chunk
+
+    Returns:
+        Tuple of (values, markers), one entry per sample
+    """
+    values = (
+        data[samples.start : samples.stop : samples.step] - _BYTE_MIDPOINT
+    ) * _BYTE_SCALE
+    markers: list[str | None] = [None] * len(values)
+    if not anomalies:
+        return values.tolist(), markers  # The common case
+
+    strongest: dict[int, AnomalyResult] = {}
+    for anomaly in anomalies:
+        offset = anomaly.position - first_position - samples.start
+        if offset < 0 or offset % samples.step:
+            continue  # Not on a drawn byte
+        i = offset // samples.step
+        if i >= len(values):
+            continue
+        best = strongest.get(i)
+        if best is None or abs(anomaly.z_score) > abs(best.z_score):
+            strongest[i] = anomaly
+
+    for i, anomaly in strongest.items():
+        values[i] = _anomaly_viz_value(anomaly.z_score)
+        markers[i] = anomaly.significance_level
+
+    return values.tolist(), markers
+
 
 @dataclass
+class _VizPacer:
+    """Pace the visualizer at one column per interval, whatever the data rate."""
+
+    interval: float
+    # time.monotonic() up to which columns have been drawn
+    drawn_until: float = field(default_factory=time.monotonic)
+
+    def samples(self, n_bytes: int) -> range:
+        """Indices of a chunk's bytes to draw for the time since the last chunk.
+
+        Samples are spread evenly and always end on the chunk's last byte,
+        where the analyzer last ran its tests.
+        """
+        now = time.monotonic()
+        count = min(n_bytes, int((now - self.drawn_until) / self.interval))
+        if count <= 0:
+            return range(0)
+
+        # Don't bank a backlog of columns when chunks are small or late
+        self.drawn_until = max(
+            self.drawn_until + count * self.interval, now - self.interval
+        )
+        step = n_bytes // count
+        return range(n_bytes - 1 - (count - 1) * step, n_bytes, step)
+
+
+class _WriterThread:
+    """Writes record batches to a capture file from a background thread.
+
+    Formatting and file I/O happen off the event loop. The queue is
+    bounded, so if the disk falls behind, write_batch() blocks until there
+    is room instead of buffering without limit. A write error stops further
+    writes and is re-raised by the next write_batch() or close().
+    """
+
+    def __init__(self, writer: BitstreamWriter, queue_size: int):
+        self._writer = writer
+        self._queue: Queue[tuple | None] = Queue(maxsize=queue_size)
+        self._error: Exception | None = None
+        self._thread = threading.Thread(
+            target=self._drain, name="capture-writer", daemon=True
+        )
+        self._thread.start()
+
+    def write_batch(self, *batch: Any) -> None:
+        """Queue a batch of BitstreamWriter.write_batch() arguments."""
+        if self._error:
+            raise self._error
+        self._queue.put(batch)
+
+    def close(self) -> None:
+        """Write out everything queued, then stop the thread."""
+        self._queue.put(None)
+        self._thread.join()
+        if self._error:
+            raise self._error
+
+    def _drain(self) -> None:
+        while (batch := self._queue.get()) is not None:
+            # Keep draining after an error so write_batch() never blocks
+            if self._error:
+                continue
+            try:
+                self._writer.write_batch(*batch)
+            except Exception as e:
+                self._error = e
+
+
+@dataclass
+class _PendingRecords:
+    """Captured bytes waiting to be written as one writer batch."""
+
+    data: bytearray = field(default_factory=bytearray)
+    first_position: int = 0
+    # (byte count, read timestamp) for each buffered chunk
+    chunk_times: list[tuple[int, float]] = field(default_factory=list)
+    # First anomaly at each flagged byte, by offset into data
+    anomalies: dict[int, tuple[str, float, float, str]] = field(default_factory=dict)
+    # time.monotonic() when the oldest buffered chunk arrived
+    started: float = 0.0
+
+    def add(
+        self,
+        data: np.ndarray,
+        first_position: int,
+        timestamp: float,
+        anomalies: list[AnomalyResult],
+    ) -> None:
+        """Buffer a chunk that directly follows the bytes already buffered."""
+        if not self.data:
+            self.first_position = first_position
+            self.started = time.monotonic()
+
+        for anomaly in anomalies:
+            self.anomalies.setdefault(
+                anomaly.position - self.first_position,
+                (
+                    anomaly.test_type,
+                    anomaly.z_score,
+                    anomaly.p_value,
+                    anomaly.significance_level,
+                ),
+            )
+        self.data += memoryview(data)
+        self.chunk_times.append((len(data), timestamp))
+
+    def flush(self, writer: BitstreamWriter | _WriterThread) -> None:
+        """Write the buffered bytes as one record per byte and reset."""
+        counts, timestamps = zip(*self.chunk_times, strict=True)
+        writer.write_batch(
+            np.arange(self.first_position, self.first_position + len(self.data)),
+            np.repeat(timestamps, counts),  # Bytes share their chunk's read time
+            np.frombuffer(self.data, dtype=np.uint8),
+            self.anomalies,
+        )
+        self.data = bytearray()
+        self.chunk_times = []
+        self.anomalies = {}
+
+
+def _new_event_loop() -> asyncio.AbstractEventLoop | None:
+    """Create a uvloop event loop, or None to use asyncio's default loop.
+
+    uvloop is an optional speedup for the capture and playback loops and
+    is not available on Windows.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop()
+
+
+async def _iter_in_thread(
+    make_items: Callable[[], Iterator[Any]], queue_size: int
+) -> AsyncIterator[Any]:
+    """Run a blocking iterator in an executor thread and yield its items.
+
+    The thread feeds a bounded queue, so blocking reads never stall the
+    event loop and the thread stays at most ``queue_size`` items ahead.
+    Errors raised by the iterator are re-raised here. Close this generator
+    when done so the thread can exit.
+
+    Args:
+        make_items: Called in the thread to create the blocking iterator
+        queue_size: Maximum number of items buffered ahead of the consumer
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=queue_size)
+    stopped = threading.Event()
+
+    def put(item: Any) -> None:
+        # Wait for room in the queue until the consumer goes away
+        future = asyncio.run_coroutine_threadsafe(queue.put(item), loop)
+        while not stopped.is_set():
+            try:
+                future.result(timeout=0.1)
+                return
+            except TimeoutError:
+                pass
+        future.cancel()
+
+    def produce() -> None:
+        last: Exception | None = None
+        try:
+            for item in make_items():
+                if stopped.is_set():
+                    return
+                put(item)
+        except Exception as e:
+            last = e
+        put(last)
+
+    loop.run_in_executor(None, produce)
+    try:
+        while (item := await queue.get()) is not None:
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stopped.set()
+
+
+# Index of each bucket in BucketScores.counts; "up" buckets come first
+RED_UP, ORANGE_UP, YELLOW_UP, RED_DOWN, ORANGE_DOWN, YELLOW_DOWN = range(6)
+
+
+def _bucket_count(index: int) -> property:
+    """Read-only view of one BucketScores counter as a plain int."""
+    return property(lambda self: int(self.counts[index]))
+
+
+@dataclass(eq=False)
 class BucketScores:
-    """Scores for one turn's anomaly buckets."""
+    """Scores for one turn's anomaly buckets.
+
+    The six counters live in one array indexed by the bucket constants,
+    so turns can be added together in a single operation.
+    """
 
-    red_up: int = 0  # *** + positive z_score
-    orange_up: int = 0  # ** + positive z_score
-    yellow_up: int = 0  # * + positive z_score
-    red_down: int = 0  # *** + negative z_score
-    orange_down: int = 0  # ** + negative z_score
-    yellow_down: int = 0  # * + negative z_score
+    counts: np.ndarray = field(default_factory=lambda: np.zeros(6, dtype=np.int32))
+
+    red_up = _bucket_count(RED_UP)  # *** + positive z_score
+    orange_up = _bucket_count(ORANGE_UP)  # ** + positive z_score
+    yellow_up = _bucket_count(YELLOW_UP)  # * + positive z_score
+    red_down = _bucket_count(RED_DOWN)  # *** + negative z_score
+    orange_down = _bucket_count(ORANGE_DOWN)  # ** + negative z_score
+    yellow_down = _bucket_count(YELLOW_DOWN)  # * + negative z_score
 
     def total_up(self) -> int:
         """Total up anomalies."""
-        return self.red_up + self.orange_up + self.yellow_up
+        return int(self.counts[:3].sum())
 
     def total_down(self) -> int:
         """Total down anomalies."""
-        return self.red_down + self.orange_down + self.yellow_down
+        return int(self.counts[3:].sum())
 
     def total(self) -> int:
         """Total anomalies."""
-        return self.total_up() + self.total_down()
+        return int(self.counts.sum())
+
+    def copy(self) -> "BucketScores":
+        """Independent copy of these scores."""
+        return BucketScores(self.counts.copy())
+
+
+# BucketScores index for each (significance level, z_score > 0) pair
+_SCORE_BUCKETS = {
+    ("***", True): RED_UP,
+    ("**", True): ORANGE_UP,
+    ("*", True): YELLOW_UP,
+    ("***", False): RED_DOWN,
+    ("**", False): ORANGE_DOWN,
+    ("*", False): YELLOW_DOWN,
+}
 
 
 @dataclass
@@ -53,16 +347,51 @@ class GameTurn:
 
     instruction: str  # "Generate more 1's" or "Generate more 0's"
     duration: float  # Turn duration in seconds
-    start_time: float = field(default_factory=time.time)
+    # Monotonic clock reading, so wall-clock adjustments don't skew turns
+    start_time: float = field(default_factory=time.monotonic)
     scores: BucketScores = field(default_factory=BucketScores)
 
-    def is_expired(self) -> bool:
-        """Check if this turn has expired."""
-        return time.time() - self.start_time >= self.duration
+    def is_expired(self, now: float | None = None) -> bool:
+        """Check if this turn has expired.
+
+        Args:
+            now: time.monotonic() reading to check against, if already taken
+        """
+        if now is None:
+            now = time.monotonic()
+        return now - self.start_time >= self.duration
+
+    def time_remaining(self, now: float | None = None) -> float:
+        """Get time remaining in this turn.
+
+        Args:
+            now: time.monotonic() reading to measure from, if already taken
+        """
+        if now is None:
+            now = time.monotonic()
+        return max(0, self.duration - (now - self.start_time))
+
+
+# Completed turns listed in the turn history widget
+RECENT_TURNS_SHOWN = 10
+
+# Private generator for turn order and length, so games can be replayed
+# by seeding it without touching the global random state
+_TURN_RNG = random.Random()
 
-    def time_remaining(self) -> float:
-        """Get time remaining in this turn."""
-        return max(0, self.duration - (time.time() - self.start_time))
+
+def _turn_summary(turn_num: int, turn: GameTurn) -> str:
+    """One-line summary of a completed turn for the history display."""
+    scores = turn.scores
+    instruction_short = "1's" if "1's" in turn.instruction else "0's"
+    total_anomalies = scores.total()
+
+    if total_anomalies > 0:
+        return (
+            f"Turn {turn_num}: {instruction_short} → "
+            f"▲{scores.total_up()} ▼{scores.total_down()} ({total_anomalies} total)"
+        )
+    return f"Turn {turn_num}: {instruction_short} → No anomalies"
 
 
 @dataclass
@@ -73,12 +402,20 @@ class GameState:
     turn_history: list[GameTurn] = field(default_factory=list)
     is_finished: bool = False
 
+    # Scores summed over turn_history, kept up to date as turns complete
+    history_totals: BucketScores = field(default_factory=BucketScores, repr=False)
+
+    # Display lines for the most recent completed turns, oldest first
+    recent_turn_lines: deque[str] = field(
+        default_factory=lambda: deque(maxlen=RECENT_TURNS_SHOWN), repr=False
+    )
+
     def start_new_turn(self) -> GameTurn:
         """Start a new game turn."""
         # Alternate instruction (random duration)
         if self.current_turn is None:
             # First turn - randomly choose starting instruction
-            instruction = random.choice(["Generate more 1's", "Generate more 0's"])
+            instruction = _TURN_RNG.choice(["Generate more 1's", "Generate more 0's"])
         else:
             # Alternate from previous turn
             if "1's" in self.current_turn.instruction:
@@ -86,11 +423,11 @@ class GameState:
             else:
                 instruction = "Generate more 1's"
 
-        duration = random.uniform(10.0, 30.0)
+        duration = _TURN_RNG.uniform(10.0, 30.0)
 
         # End current turn if exists
         if self.current_turn:
-            self.turn_history.append(self.current_turn)
+            self._archive_turn(self.current_turn)
 
         # Start new turn
         self.current_turn = GameTurn(instruction=instruction, duration=duration)
@@ -101,57 +438,113 @@ class GameState:
         if not self.current_turn or self.is_finished:
             return
 
-        scores = self.current_turn.scores
-
-        # Determine direction based on z_score
-        is_up = anomaly.z_score > 0
-
-        # Categorize by significance level and direction
-        if anomaly.significance_level == "***":
-            if is_up:
-                scores.red_up += 1
-            else:
-                scores.red_down += 1
-        elif anomaly.significance_level == "**":
-            if is_up:
-                scores.orange_up += 1
-            else:
-                scores.orange_down += 1
-        elif anomaly.significance_level == "*":
-            if is_up:
-                scores.yellow_up += 1
-            else:
-                scores.yellow_down += 1
+        # Direction comes from the sign of the z_score
+        bucket = _SCORE_BUCKETS.get((anomaly.significance_level, anomaly.z_score > 0))
+        if bucket is not None:
+            self.current_turn.scores.counts[bucket] += 1
 
     def finish_game(self) -> None:
         """Finish the game and add current turn to history."""
         if self.current_turn:
-            self.turn_history.append(self.current_turn)
+            self._archive_turn(self.current_turn)
             self.current_turn = None
         self.is_finished = True
 
+    def _archive_turn(self, turn: GameTurn) -> None:
+        """Move a finished turn into the history and add it to the totals."""
+        self.turn_history.append(turn)
+        self.history_totals.counts += turn.scores.counts
+        self.recent_turn_lines.append(_turn_summary(len(self.turn_history), turn))
+
     def get_overall_stats(self) -> BucketScores:
         """Get combined statistics across all turns."""
-        total = BucketScores()
-        for turn in self.turn_history:
-            total.red_up += turn.scores.red_up
-            total.orange_up += turn.scores.orange_up
-            total.yellow_up += turn.scores.yellow_up
-            total.red_down += turn.scores.red_down
-            total.orange_down += turn.scores.orange_down
-            total.yellow_down += turn.scores.yellow_down
-        return total
-
-
-class BitstreamVisualizer(Static):
+        return self.history_totals.copy()
+
+
+# Wave character style for each anomaly significance level
+_ANOMALY_STYLES = {
+    "***": "bold red",
+    "**": "bold yellow",
+    "*": "yellow",
+}
+
+
+@cache
+def _instruction_markup(instruction: str) -> str:
+    """Color-coded markup line for a game instruction."""
+    color = "bold cyan" if "1's" in instruction else "bold magenta"
+    return f"[{color}]{instruction}[/{color}]\n"
+
+
+class ThrottledStatic(Static):
+    """Static widget that repaints at most REFRESH_RATE times per second.
+
+    Updates mark the widget dirty instead of calling refresh() directly,
+    so data can arrive much faster than the display needs to redraw. The
+    app repaints every dirty widget together on one timer (see
+    RNGVisualizerApp.repaint_widgets). Subclasses build their panel text
+    in build_content(), which only runs when content_key() reports that
+    the underlying data changed.
+    """
+
+    REFRESH_RATE = 30
+    PANEL_TITLE = ""
+    PANEL_STYLE = "none"
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._dirty = False
+        self._version = 0
+        # Reused across renders; only its contents change
+        self._panel = Panel("", title=self.PANEL_TITLE, style=self.PANEL_STYLE)
+        # Never equal to a real key, so the first render builds content
+        self._content_key: object = object()
+
+    def mark_dirty(self) -> None:
+        """Schedule a repaint on the next timer tick."""
+        self._version += 1
+        self._dirty = True
+
+    def refresh_if_dirty(self) -> None:
+        """Repaint if anything changed since the last tick."""
+        if self._dirty:
+            self._dirty = False
+            if self.content_key() != self._content_key:
+                self.refresh()
+
+    def content_key(self) -> object:
+        """Value that changes whenever the rendered content would.
+
+        Defaults to a counter bumped by mark_dirty(); widgets whose updates
+        often leave the display unchanged return something more specific.
+        """
+        return self._version
+
+    def build_content(self) -> str | Text:
+        """Build the panel text for the current data; empty by default."""
+        return ""
+
+    def render(self) -> Panel:
+        """Render the panel, rebuilding its text only if the data changed."""
+        key = self.content_key()
+        if key != self._content_key:
+            self._panel.renderable = self.build_content()
+            self._content_key = key
+        return self._panel
+
+
+class BitstreamVisualizer(ThrottledStatic):
     """Widget for visualizing the bitstream as a scrolling wave."""
 
+    PANEL_TITLE = "RNG Bitstream Visualization"
+
     def __init__(self, width: int = 70, height: int = 10, **kwargs):
         super().__init__(**kwargs)
         self.width = width
         self.height = height
-        self.data_points: list[float] = [0.0] * width
-        self.anomaly_points: list[str | None] = [None] * width
+        # Fixed-length ring buffers: appending evicts the oldest point
+        self.data_points: deque[float] = deque([0.0] * width, maxlen=width)
+        self.anomaly_points: deque[str | None] = deque([None] * width, maxlen=width)
         self.position = 0
 
     def add_data_point(self, value: float, anomaly: str | None = None) -> None:
@@ -164,62 +557,82 @@ class BitstreamVisualizer(Static):
         self.data_points.append(value)
         self.anomaly_points.append(anomaly)
 
-        # Keep only the latest width points
-        if len(self.data_points) > self.width:
-            self.data_points.pop(0)
-            self.anomaly_points.pop(0)
-
         self.position += 1
-        self.refresh()
+        self.mark_dirty()
 
-    def render(self) -> Panel:
-        """Render the bitstream visualization."""
-        lines = []
+    def add_data_points(
+        self, values: Sequence[float], anomalies: Sequence[str | None]
+    ) -> None:
+        """Add several data points at once, marking the widget dirty once.
 
-        # Create the wave visualization
-        mid_line = self.height // 2
+        Args:
+            values: Normalized values (-1 to 1, where 0 is baseline)
+            anomalies: Anomaly significance marker (or None) for each value
+        """
+        # Only the newest points fit in the ring buffers, so skip the rest
+        # rather than appending and evicting them straight away
+        self.data_points.extend(values[-self.width :])
+        self.anomaly_points.extend(anomalies[-self.width :])
 
-        for row in range(self.height):
-            line_chars = []
+        self.position += len(values)
+        self.mark_dirty()
 
+    def build_content(self) -> Text:
+        """Build the bitstream visualization.
+
+        Returns styled Text rather than a markup string, so Rich doesn't
+        have to parse markup for every frame.
+        """
+        # Create the wave visualization
+        mid_line = self.height // 2
+        width = len(self.data_points)
+
+        # Start from a blank grid with the baseline, then place each column's
+        # single point, instead of evaluating every (row, column) cell
+        grid = [[" "] * width for _ in range(self.height)]
+        grid[mid_line] = ["─"] * width  # Baseline
+        styled: list[tuple[int, int, str]] = []
+
+        if not any(self.anomaly_points):
+            # Usually nothing in view is anomalous, so every point is a plain
+            # dash and the per-column anomaly checks can be skipped
+            for col, value in enumerate(self.data_points):
+                # Convert value (-1 to 1) to row position
+                value_row = mid_line - int(value * mid_line)
+                if 0 <= value_row < self.height:
+                    grid[value_row][col] = "━"
+        else:
             for col, (value, anomaly) in enumerate(
                 zip(self.data_points, self.anomaly_points, strict=False)
             ):
                 # Convert value (-1 to 1) to row position
                 value_row = mid_line - int(value * mid_line)
+                if not 0 <= value_row < self.height:
+                    continue
 
-                if row == value_row:
-                    if anomaly:
-                        # Use different characters for different significance levels
-                        char = "▲" if value > 0 else "▼"
-                        if anomaly == "***":
-                            char = f"[bold red]{char}[/bold red]"
-                        elif anomaly == "**":
-                            char = f"[bold yellow]{char}[/bold yellow]"
-                        elif anomaly == "*":
-                            char = f"[yellow]{char}[/yellow]"
-                    else:
-                        char = "━"
-                elif row == mid_line:
-                    char = "─"  # Baseline
+                if anomaly:
+                    # Use different characters for different significance levels
+                    grid[value_row][col] = "▲" if value > 0 else "▼"
+                    style = _ANOMALY_STYLES.get(anomaly)
+                    if style is not None:
+                        styled.append((value_row, col, style))
                 else:
-                    char = " "
+                    grid[value_row][col] = "━"
 
-                line_chars.append(char)
+        self._panel.subtitle = f"Position: {self.position}"
+        text = Text("\n".join(map("".join, grid)))
+        for row, col, style in styled:
+            # Each grid row is width characters plus a newline
+            offset = row * (width + 1) + col
+            text.stylize(style, offset, offset + 1)
+        return text
 
-            lines.append("".join(line_chars))
 
-        content = "\n".join(lines)
-        return Panel(
-            content,
-            title="RNG Bitstream Visualization",
-            subtitle=f"Position: {self.position}",
-        )
-
-
-class StatsDisplay(Static):
+class StatsDisplay(ThrottledStatic):
     """Widget for displaying statistical information."""
 
+    PANEL_TITLE = "Statistics"
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.stats = {}
@@ -227,10 +640,24 @@ class StatsDisplay(Static):
     def update_stats(self, stats: dict) -> None:
         """Update displayed statistics."""
         self.stats = stats
-        self.refresh()
+        self.mark_dirty()
+
+    def content_key(self) -> object:
+        """Displayed values, rounded as shown, so unchanged stats skip a rebuild."""
+        stats = self.stats
+        if not stats:
+            return None
+        return (
+            stats.get("total_bits", 0),
+            round(stats.get("ones_ratio", 0), 4),
+            round(stats.get("byte_mean", 0), 2),
+            round(stats.get("byte_std", 0), 2),
+            stats.get("total_anomalies", 0),
+            stats.get("current_position", 0),
+        )
 
-    def render(self) -> Panel:
-        """Render the statistics display."""
+    def build_content(self) -> str:
+        """Build the statistics display."""
         if not self.stats:
             content = "Waiting for data..."
         else:
@@ -244,12 +671,14 @@ class StatsDisplay(Static):
             ]
             content = "\n".join(lines)
 
-        return Panel(content, title="Statistics")
+        return content
 
 
-class DeviceStatus(Static):
+class DeviceStatus(ThrottledStatic):
     """Widget for displaying device status."""
 
+    PANEL_TITLE = "Device Status"
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.device_info = {}
@@ -257,10 +686,10 @@ class DeviceStatus(Static):
     def update_device_info(self, device_info: dict) -> None:
         """Update device information."""
         self.device_info = device_info
-        self.refresh()
+        self.mark_dirty()
 
-    def render(self) -> Panel:
-        """Render device status."""
+    def build_content(self) -> str:
+        """Build device status."""
         if not self.device_info:
             content = "No device connected"
         else:
@@ -276,23 +705,27 @@ class DeviceStatus(Static):
             ]
             content = "\n".join(lines)
 
-        return Panel(content, title="Device Status")
+        return content
 
 
-class GameInstructionDisplay(Static):
+class GameInstructionDisplay(ThrottledStatic):
     """Widget for displaying current game instruction and timer."""
 
+    PANEL_TITLE = "🎯 Game Instructions"
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.game_state: GameState | None = None
+        # Countdown text from the latest content_key(), reused by build_content()
+        self._countdown = ""
 
     def update_game_state(self, game_state: GameState) -> None:
         """Update game state."""
         self.game_state = game_state
-        self.refresh()
+        self.mark_dirty()
 
-    def render(self) -> Panel:
-        """Render game instruction and timer."""
+    def build_content(self) -> str:
+        """Build game instruction and timer."""
         if not self.game_state or not self.game_state.current_turn:
             if self.game_state and self.game_state.is_finished:
                 content = "[bold green]🎯 Game Finished![/bold green]\n\nPress F to view final results"
@@ -300,25 +733,26 @@ class GameInstructionDisplay(Static):
                 content = "Game starting..."
         else:
             turn = self.game_state.current_turn
-            time_left = turn.time_remaining()
-
-            # Color-code the instruction
-            if "1's" in turn.instruction:
-                instruction_color = "[bold cyan]"
-                close_color = "[/bold cyan]"
-            else:
-                instruction_color = "[bold magenta]"
-                close_color = "[/bold magenta]"
+            content = _instruction_markup(turn.instruction)
+            content += f"⏰ Time left: {self._countdown}s"
 
-            content = f"{instruction_color}{turn.instruction}{close_color}\n"
-            content += f"⏰ Time left: {time_left:.1f}s"
+        return content
 
-        return Panel(content, title="🎯 Game Instructions")
+    def content_key(self) -> object:
+        """Current turn and the countdown as displayed."""
+        if not self.game_state or not self.game_state.current_turn:
+            return self.game_state is not None and self.game_state.is_finished
+        turn = self.game_state.current_turn
+        self._countdown = f"{turn.time_remaining():.1f}"
+        return id(turn), self._countdown
 
 
-class CurrentBucketDisplay(Static):
+class CurrentBucketDisplay(ThrottledStatic):
     """Widget for displaying current turn's bucket scores."""
 
+    PANEL_TITLE = "📊 Current Turn"
+    PANEL_STYLE = "bold"
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.game_state: GameState | None = None
@@ -326,10 +760,10 @@ class CurrentBucketDisplay(Static):
     def update_game_state(self, game_state: GameState) -> None:
         """Update game state."""
         self.game_state = game_state
-        self.refresh()
+        self.mark_dirty()
 
-    def render(self) -> Panel:
-        """Render current bucket scores."""
+    def build_content(self) -> str:
+        """Build current bucket scores."""
         if not self.game_state or not self.game_state.current_turn:
             content = "No active turn"
         else:
@@ -344,12 +778,21 @@ class CurrentBucketDisplay(Static):
             ]
             content = "\n".join(lines)
 
-        return Panel(content, title="📊 Current Turn", style="bold")
+        return content
 
+    def content_key(self) -> object:
+        """Current turn and its anomaly count, which only ever grows."""
+        if not self.game_state or not self.game_state.current_turn:
+            return None
+        turn = self.game_state.current_turn
+        return id(turn), turn.scores.total()
 
-class GameHistoryDisplay(Static):
+
+class GameHistoryDisplay(ThrottledStatic):
     """Widget for displaying game turn history."""
 
+    PANEL_TITLE = "📈 Turn History"
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.game_state: GameState | None = None
@@ -357,43 +800,31 @@ class GameHistoryDisplay(Static):
     def update_game_state(self, game_state: GameState) -> None:
         """Update game state."""
         self.game_state = game_state
-        self.refresh()
+        self.mark_dirty()
 
-    def render(self) -> Panel:
-        """Render turn history."""
+    def build_content(self) -> str:
+        """Build turn history."""
         if not self.game_state or not self.game_state.turn_history:
             content = "No completed turns yet"
         else:
-            lines = []
+            # Lines for the last few turns are formatted once as turns end
+            lines = list(self.game_state.recent_turn_lines)
             total_turns = len(self.game_state.turn_history)
-            recent_turns = self.game_state.turn_history[-10:]  # Show last 10 turns
-
-            for i, turn in enumerate(recent_turns):
-                # Calculate actual turn number
-                turn_num = total_turns - len(recent_turns) + i + 1
-                scores = turn.scores
-                instruction_short = "1's" if "1's" in turn.instruction else "0's"
-                total_anomalies = scores.total()
-
-                if total_anomalies > 0:
-                    lines.append(
-                        f"Turn {turn_num}: {instruction_short} → "
-                        f"▲{scores.total_up()} ▼{scores.total_down()} ({total_anomalies} total)"
-                    )
-                else:
-                    lines.append(f"Turn {turn_num}: {instruction_short} → No anomalies")
-
-            if total_turns > 10:
-                lines.insert(0, f"(Showing last 10 of {total_turns} turns)")
-            elif total_turns == 0:
-                lines.append("No completed turns yet")
+            if total_turns > len(lines):
+                lines.insert(0, f"(Showing last {len(lines)} of {total_turns} turns)")
 
             content = "\n".join(lines)
 
-        return Panel(content, title="📈 Turn History")
+        return content
+
+    def content_key(self) -> object:
+        """Number of completed turns."""
+        if not self.game_state:
+            return None
+        return len(self.game_state.turn_history)
 
 
-class GameOverallStats(Static):
+class GameOverallStats(ThrottledStatic):
     """Widget for displaying overall game statistics."""
 
     def __init__(self, **kwargs):
@@ -403,10 +834,10 @@ class GameOverallStats(Static):
     def update_game_state(self, game_state: GameState) -> None:
         """Update game state."""
         self.game_state = game_state
-        self.refresh()
+        self.mark_dirty()
 
-    def render(self) -> Panel:
-        """Render overall statistics."""
+    def build_content(self) -> str:
+        """Build overall statistics."""
         if not self.game_state or len(self.game_state.turn_history) == 0:
             if self.game_state and self.game_state.is_finished:
                 content = "Game finished but no turns completed"
@@ -441,12 +872,18 @@ class GameOverallStats(Static):
 
             content = "\n".join(lines)
 
-        title = (
+        self._panel.title = (
             "🏆 Overall Results"
             if self.game_state and self.game_state.is_finished
             else "📊 Game Progress"
         )
-        return Panel(content, title=title)
+        return content
+
+    def content_key(self) -> object:
+        """Number of completed turns and whether the game has finished."""
+        if not self.game_state:
+            return None
+        return len(self.game_state.turn_history), self.game_state.is_finished
 
 
 class RNGVisualizerApp(App):
@@ -501,24 +938,60 @@ class RNGVisualizerApp(App):
         ("f", "finish_game", "Finish Game"),
     ]
 
+    # Chunks buffered between the device reader thread and the capture loop
+    CHUNK_QUEUE_SIZE = 32
+    # Seconds of wall time per visualizer column while capturing
+    VIZ_POINT_INTERVAL = 0.02
+
+    # Seconds of wall time per record and per visualizer column during playback
+    PLAYBACK_RECORD_INTERVAL = 0.02
+    PLAYBACK_POINT_INTERVAL = 0.2
+
+    # Playback records are read ahead in a thread, this many per batch,
+    # with up to PLAYBACK_QUEUE_SIZE batches waiting
+    PLAYBACK_BATCH_SIZE = 1024
+    PLAYBACK_QUEUE_SIZE = 4
+
+    # Captured bytes are handed to the writer once this many are buffered,
+    # or once the oldest has waited this many seconds
+    WRITE_BATCH_SIZE = 4096
+    WRITE_BATCH_INTERVAL = 1.0
+    # Batches queued for the writer thread before capture waits on the disk
+    WRITE_QUEUE_SIZE = 8
+
     def __init__(self):
         super().__init__()
         self.device: TrueRNGDevice | None = None
         self.analyzer: RandomnessAnalyzer | None = None
         self.writer: BitstreamWriter | None = None
+        self._writer_thread: _WriterThread | None = None
         self.reader: BitstreamReader | None = None
         self.is_live_mode = False
         self.is_game_mode = False
-        self.is_paused = False
+        # Set while running, cleared while paused
+        self._resumed = asyncio.Event()
+        self._resumed.set()
         self.capture_task: asyncio.Task | None = None
         self._shutting_down = False
+        self._pending_records = _PendingRecords()
+        # Flagged by the capture loops, serviced once per repaint tick
+        self._stats_stale = False
+        self._game_stale = False
+        # Widget references, looked up once on mount
+        self._stats_display: StatsDisplay | None = None
+        self._throttled_widgets: list[ThrottledStatic] = []
+        self._game_widgets: (
+            tuple[
+                GameInstructionDisplay,
+                CurrentBucketDisplay,
+                GameHistoryDisplay,
+                GameOverallStats,
+            ]
+            | None
+        ) = None
 
         # Game state
         self.game_state: GameState | None = None
-        self.game_timer_task: asyncio.Task | None = None
-
-        # Set up signal handlers for graceful shutdown
-        self._setup_signal_handlers()
 
     def compose(self) -> ComposeResult:
         """Compose the application layout."""
@@ -558,29 +1031,52 @@ class RNGVisualizerApp(App):
         yield Footer()
 
     def _setup_signal_handlers(self) -> None:
-        """Set up signal handlers for graceful shutdown."""
+        """Set up signal handlers for graceful shutdown.
+
+        The handlers are registered with the running event loop, so they run
+        on the loop between callbacks instead of interrupting whatever code
+        happens to be executing.
+        """
+        loop = asyncio.get_running_loop()
 
         def signal_handler(signum, frame):
-            """Handle shutdown signals."""
-            if not self._shutting_down:
-                # Schedule the cleanup in the event loop
-                if hasattr(self, "_loop") and self._loop and not self._loop.is_closed():
-                    asyncio.create_task(self._graceful_shutdown())
-                else:
-                    # Fallback for immediate shutdown
-                    self._emergency_cleanup()
-                    sys.exit(0)
+            """Hop onto the loop, or clean up directly once it has closed."""
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(self._on_shutdown_signal)
+            else:
+                # Fallback for immediate shutdown
+                self._emergency_cleanup()
+                sys.exit(0)
+
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self._on_shutdown_signal)
+            except NotImplementedError:
+                # Windows event loops have no signal handler support, so hop
+                # from the Python-level handler onto the loop instead
+                signal.signal(sig, signal_handler)
 
-        # Set up signal handlers for Ctrl+C and other termination signals
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
+    def _on_shutdown_signal(self) -> None:
+        """Handle shutdown signals."""
+        if not self._shutting_down:
+            asyncio.create_task(self._graceful_shutdown())
 
     def on_mount(self) -> None:
         """Called when app is mounted."""
         self.title = "RNG Visualizer"
         self.sub_title = "TrueRNG Pro V2 Bitstream Analyzer"
-        # Store reference to event loop for signal handling
-        self._loop = asyncio.get_event_loop()
+        self._stats_display = self.query_one("#stats_display", StatsDisplay)
+        self._throttled_widgets = list(self.query(ThrottledStatic))
+        if self.is_game_mode:
+            self._game_widgets = (
+                self.query_one("#game_instruction", GameInstructionDisplay),
+                self.query_one("#current_bucket", CurrentBucketDisplay),
+                self.query_one("#game_history_left", GameHistoryDisplay),
+                self.query_one("#game_overall", GameOverallStats),
+            )
+        self.set_interval(1 / ThrottledStatic.REFRESH_RATE, self.repaint_widgets)
+        # Set up signal handlers for graceful shutdown
+        self._setup_signal_handlers()
 
     async def action_quit(self) -> None:
         """Quit the application."""
@@ -628,15 +1124,22 @@ class RNGVisualizerApp(App):
                     "File playback mode - no saving needed", title="💾 Save Status"
                 )
 
+    @property
+    def is_paused(self) -> bool:
+        """Whether capture or playback is paused."""
+        return not self._resumed.is_set()
+
     async def action_pause(self) -> None:
         """Pause data capture or playback."""
-        self.is_paused = True
+        self._resumed.clear()
+        # Nothing new is saved while paused, so write out what is pending
+        self._flush_records()
         mode_text = "playback" if not self.is_live_mode else "data capture"
         self.notify(f"{mode_text.title()} paused - press R to resume", title="⏸️ Paused")
 
     async def action_resume(self) -> None:
         """Resume data capture or playback."""
-        self.is_paused = False
+        self._resumed.set()
         mode_text = "playback" if not self.is_live_mode else "data capture"
         self.notify(f"{mode_text.title()} resumed", title="▶️ Resumed")
 
@@ -681,8 +1184,11 @@ class RNGVisualizerApp(App):
                         window_size=1000,
                         sensitivity=0.01,
                     )
-                    self.writer = BitstreamWriter(save_path, metadata)
+                    self.writer = create_writer(save_path, metadata)
                     self.writer.__enter__()
+                    self._writer_thread = _WriterThread(
+                        self.writer, self.WRITE_QUEUE_SIZE
+                    )
 
                 # Update device status
                 device_status = self.query_one("#device_status", DeviceStatus)
@@ -698,7 +1204,7 @@ class RNGVisualizerApp(App):
                 # Also try to notify through UI if available
                 try:
                     self.notify(error_msg, severity="error")
-                except:
+                except Exception:
                     pass  # UI might not be ready yet
 
                 # Keep the app running to show the error
@@ -712,7 +1218,7 @@ class RNGVisualizerApp(App):
         self.call_later(setup_live)
 
         # Start the Textual application
-        self.run()
+        self._run_app()
 
     def run_file_mode(self, file_path: Path) -> None:
         """Run in file viewing mode."""
@@ -736,13 +1242,13 @@ class RNGVisualizerApp(App):
                 # Also try to notify through UI if available
                 try:
                     self.notify(error_msg, severity="error")
-                except:
+                except Exception:
                     pass  # UI might not be ready yet
 
         self.call_later(setup_file)
 
         # Start the Textual application
-        self.run()
+        self._run_app()
 
     def run_game_mode(
         self, save_path: Path | None = None, device_path: str | None = None
@@ -770,21 +1276,21 @@ class RNGVisualizerApp(App):
                         window_size=1000,
                         sensitivity=0.01,
                     )
-                    self.writer = BitstreamWriter(save_path, metadata)
+                    self.writer = create_writer(save_path, metadata)
                     self.writer.__enter__()
+                    self._writer_thread = _WriterThread(
+                        self.writer, self.WRITE_QUEUE_SIZE
+                    )
 
                 # Update device status
                 device_status = self.query_one("#device_status", DeviceStatus)
                 device_status.update_device_info(self.device.get_status())
 
-                # Start first game turn
+                # Start first game turn; the repaint timer advances turns
                 self.game_state.start_new_turn()
 
-                # Start game timer task
-                self.game_timer_task = asyncio.create_task(self._game_timer_loop())
-
                 # Start capture task
-                self.capture_task = asyncio.create_task(self._game_capture_loop())
+                self.capture_task = asyncio.create_task(self._capture_loop())
 
             except Exception as e:
                 error_msg = f"Error setting up game mode: {e}"
@@ -793,7 +1299,7 @@ class RNGVisualizerApp(App):
                 # Also try to notify through UI if available
                 try:
                     self.notify(error_msg, severity="error")
-                except:
+                except Exception:
                     pass  # UI might not be ready yet
 
                 # Keep the app running to show the error
@@ -807,7 +1313,7 @@ class RNGVisualizerApp(App):
         self.call_later(setup_game)
 
         # Start the Textual application
-        self.run()
+        self._run_app()
 
     def run_game_file_mode(self, file_path: Path) -> None:
         """Run in game file replay mode."""
@@ -824,7 +1330,7 @@ class RNGVisualizerApp(App):
                 self.notify(f"Loaded game file: {file_path.name}")
 
                 # Start playback task
-                self.capture_task = asyncio.create_task(self._game_playback_loop())
+                self.capture_task = asyncio.create_task(self._playback_loop())
 
             except Exception as e:
                 error_msg = f"Error loading game file: {e}"
@@ -833,13 +1339,22 @@ class RNGVisualizerApp(App):
                 # Also try to notify through UI if available
                 try:
                     self.notify(error_msg, severity="error")
-                except:
+                except Exception:
                     pass  # UI might not be ready yet
 
         self.call_later(setup_game_file)
 
         # Start the Textual application
-        self.run()
+        self._run_app()
+
+    def _run_app(self) -> None:
+        """Run the Textual application, on uvloop when it is installed."""
+        loop = _new_event_loop()
+        try:
+            self.run(loop=loop)
+        finally:
+            if loop is not None:
+                loop.close()
 
     def run_interactive_mode(self, device_path: str | None = None) -> None:
         """Run in interactive mode selection."""
@@ -847,139 +1362,242 @@ class RNGVisualizerApp(App):
         # In a full implementation, this would show a selection screen
         self.run_live_mode(device_path=device_path)
 
+    def _device_chunks(
+        self, chunk_size: int = TrueRNGDevice.CHUNK_SIZE
+    ) -> AsyncIterator[tuple[float, bytes]]:
+        """Stream device chunks without blocking the event loop.
+
+        The device's blocking iterator runs in an executor thread, so waiting
+        on the serial port never stalls the UI. Close the iterator when done
+        so the worker thread can exit.
+
+        Args:
+            chunk_size: Maximum size of each chunk
+
+        Returns:
+            Async iterator of (read time, chunk) pairs; the read time is taken
+            once per chunk as it comes off the device, before any queueing
+            delay. It is Unix time anchored at the start of the stream and
+            advanced by time.monotonic(), so wall clock steps never reorder
+            records.
+        """
+        device = self.device
+        epoch_offset = time.time() - time.monotonic()
+
+        def read_chunks() -> Iterator[tuple[float, bytes]]:
+            for chunk in device.stream_bytes(chunk_size=chunk_size):
+                yield epoch_offset + time.monotonic(), chunk
+
+        return _iter_in_thread(read_chunks, self.CHUNK_QUEUE_SIZE)
+
+    def _record_batches(self) -> AsyncIterator[dict[str, np.ndarray]]:
+        """Read playback records ahead in an executor thread.
+
+        Close the iterator when done so the worker thread can exit.
+
+        Returns:
+            Async iterator of column batches of up to PLAYBACK_BATCH_SIZE
+            records, as from BitstreamReader.iter_column_batches
+        """
+        reader = self.reader
+        return _iter_in_thread(
+            lambda: reader.iter_column_batches(self.PLAYBACK_BATCH_SIZE),
+            self.PLAYBACK_QUEUE_SIZE,
+        )
+
+    def _save_chunk(
+        self,
+        data: np.ndarray,
+        first_position: int,
+        read_time: float,
+        anomalies: list[AnomalyResult],
+    ) -> None:
+        """Queue a captured chunk for the writer, writing out full batches.
+
+        Args:
+            data: Chunk byte values
+            first_position: Stream position of the chunk's first byte
+            read_time: When the chunk was read; shared by all of its bytes
+            anomalies: Anomalies found in the chunk
+        """
+        pending = self._pending_records
+        pending.add(data, first_position, read_time, anomalies)
+        if (
+            len(pending.data) >= self.WRITE_BATCH_SIZE
+            or time.monotonic() - pending.started >= self.WRITE_BATCH_INTERVAL
+        ):
+            self._flush_records()
+
+    def _flush_records(self) -> None:
+        """Write any captured bytes still waiting for a full batch."""
+        if self._writer_thread and self._pending_records.data:
+            self._pending_records.flush(self._writer_thread)
+
+    def _close_writer(self) -> None:
+        """Write out pending records, then close the capture file.
+
+        The writer thread is stopped and the file closed even if a write
+        failed; the write error is re-raised afterwards.
+        """
+        try:
+            try:
+                self._flush_records()
+            finally:
+                if self._writer_thread:
+                    writer_thread, self._writer_thread = self._writer_thread, None
+                    writer_thread.close()
+        finally:
+            if self.writer:
+                self.writer.__exit__(None, None, None)
+
     async def _capture_loop(self) -> None:
-        """Main capture loop for live mode."""
+        """Main capture loop for live and game mode."""
         if not self.device or not self.analyzer:
             return
 
         visualizer = self.query_one("#visualizer", BitstreamVisualizer)
-        stats_display = self.query_one("#stats_display", StatsDisplay)
 
-        # Counter to throttle visualization updates
-        viz_update_counter = 0
-        viz_update_frequency = (
-            10  # Only update visualization every 10th byte (2x slower)
-        )
+        # Draw at a steady pace however fast data arrives
+        pacer = _VizPacer(self.VIZ_POINT_INTERVAL)
 
+        chunks = self._device_chunks()
         try:
-            for chunk in self.device.stream_bytes(chunk_size=10):  # Smaller chunks
+            async for read_time, chunk in chunks:
                 # Check for shutdown or pause
                 if self._shutting_down:
                     break
                 if self.is_paused:
-                    await asyncio.sleep(0.1)
-                    continue
+                    continue  # Drain the device, discarding data while paused
 
-                for byte_val in chunk:
-                    # Analyze byte for anomalies
-                    anomalies = self.analyzer.add_byte(byte_val)
-
-                    # Calculate visualization value
-                    # Convert byte value to normalized range (-1 to 1)
-                    viz_value = (byte_val - 127.5) / 127.5
-
-                    # Check for anomalies
-                    anomaly_marker = None
-                    if anomalies:
-                        # Use the most significant anomaly
-                        strongest = max(anomalies, key=lambda a: abs(a.z_score))
-                        anomaly_marker = strongest.significance_level
-                        viz_value = (
-                            strongest.z_score / 5.0
-                        )  # Scale z-score for visualization
-                        viz_value = max(-1, min(1, viz_value))  # Clamp to [-1, 1]
-
-                    # Only update visualization every few bytes to slow down scrolling
-                    viz_update_counter += 1
-                    if viz_update_counter >= viz_update_frequency:
-                        # Update visualization
-                        visualizer.add_data_point(viz_value, anomaly_marker)
-
-                        # Update statistics less frequently too
-                        stats = self.analyzer.get_summary_stats()
-                        stats_display.update_stats(stats)
+                data = np.frombuffer(chunk, dtype=np.uint8)
+                first_position = self.analyzer.position + 1
 
-                        viz_update_counter = 0  # Reset counter
-
-                    # Save to file if writer available
-                    if self.writer:
-                        record = BitstreamRecord(
-                            position=self.analyzer.position,
-                            timestamp=time.time(),
-                            byte_value=byte_val,
-                            anomaly_type=anomalies[0].test_type if anomalies else None,
-                            z_score=anomalies[0].z_score if anomalies else None,
-                            p_value=anomalies[0].p_value if anomalies else None,
-                            significance=anomalies[0].significance_level
-                            if anomalies
-                            else None,
-                        )
-                        self.writer.write_record(record)
+                # Analyze the whole chunk for anomalies at once
+                anomalies = self.analyzer.add_bytes(data)
+
+                # Score anomalies in game mode
+                if self.game_state:
+                    for anomaly in anomalies:
+                        self.game_state.add_anomaly(anomaly)
+                    self._game_stale = True
+
+                # Only draw the bytes due for display, to keep scrolling steady
+                samples = pacer.samples(len(data))
+                if samples:
+                    values, markers = _viz_samples(
+                        data, samples, first_position, anomalies
+                    )
+                    visualizer.add_data_points(values, markers)
+
+                # Statistics are summarized on the next repaint tick
+                self._stats_stale = True
 
-                # Small delay to control update rate (more frequent but shorter delays)
-                await asyncio.sleep(
-                    0.02
-                )  # Shorter delay since we're processing smaller chunks
+                # Save to file if writer available
+                if self.writer:
+                    self._save_chunk(data, first_position, read_time, anomalies)
+
+                # Let the UI run between chunks when data is queued back to back
+                await asyncio.sleep(0)
 
         except Exception as e:
-            self.notify(f"Capture error: {e}", severity="error")
+            mode = "Game capture" if self.game_state else "Capture"
+            self.notify(f"{mode} error: {e}", severity="error")
+        finally:
+            await chunks.aclose()
+            self._flush_records()
 
     async def _playback_loop(self) -> None:
-        """Playback loop for file mode."""
+        """Playback loop for file mode and game replays."""
         if not self.reader:
             return
 
         visualizer = self.query_one("#visualizer", BitstreamVisualizer)
         stats_display = self.query_one("#stats_display", StatsDisplay)
 
-        # Counter to throttle visualization updates (same as live mode)
-        viz_update_counter = 0
-        viz_update_frequency = 10  # Same throttling as live mode
+        # Game replays re-analyze the bytes to score the turns again
+        if self.game_state:
+            self.analyzer = RandomnessAnalyzer(window_size=1000, sensitivity=0.01)
+
+        # Draw at a steady pace, even if processing falls behind the records
+        pacer = _VizPacer(self.PLAYBACK_POINT_INTERVAL)
+
+        # One stats dict, updated in place for each drawn record
+        stats = {
+            "current_position": 0,
+            "total_bits": 0,
+            "ones_ratio": 0.5,  # Would calculate from data
+            "byte_mean": 0,
+            "byte_std": 0.0,
+            "total_anomalies": 0,
+        }
 
+        # Each record is due one interval after the previous one, so time
+        # spent processing and timer overshoot don't slow playback down
+        due = time.monotonic()
+
+        batches = self._record_batches()
         try:
             position = 0
-            for record in self.reader.iter_records():
-                # Check for shutdown or pause
-                if self._shutting_down:
-                    break
-                if self.is_paused:
-                    await asyncio.sleep(0.1)
-                    continue
+            async for columns in batches:
+                # Work out the whole batch's values up front, so each record
+                # below is only a few list lookups
+                byte_values = columns["byte_value"].tolist()
+                viz_values = _record_viz_values(
+                    columns["byte_value"], columns["z_score"]
+                )
+                anomaly_types = columns["anomaly_type"].tolist()
+                significances = columns["significance"].tolist()
+
+                # Game replays analyze the batch the same way live capture
+                # does, then score each anomaly when its record plays
+                replayed: dict[int, list[AnomalyResult]] = {}
+                if self.game_state and self.analyzer:
+                    first_position = self.analyzer.position + 1
+                    byte_array = columns["byte_value"].astype(np.uint8, copy=False)
+                    for anomaly in self.analyzer.add_bytes(byte_array):
+                        replayed.setdefault(
+                            anomaly.position - first_position, []
+                        ).append(anomaly)
+
+                for i, byte_value in enumerate(byte_values):
+                    # Check for shutdown or pause
+                    if self._shutting_down:
+                        return
+                    if self.is_paused:
+                        await self._resumed.wait()
+                        due = time.monotonic()
+
+                    if self.game_state:
+                        for anomaly in replayed.get(i, ()):
+                            self.game_state.add_anomaly(anomaly)
+
+                    # Only draw the records due for display
+                    if pacer.samples(1):
+                        visualizer.add_data_point(viz_values[i], significances[i])
 
-                # Calculate visualization value
-                viz_value = (record.byte_value - 127.5) / 127.5
-
-                # Use recorded anomaly data
-                anomaly_marker = record.significance
-                if record.z_score is not None:
-                    viz_value = record.z_score / 5.0
-                    viz_value = max(-1, min(1, viz_value))
-
-                # Only update visualization every few records to match live mode speed
-                viz_update_counter += 1
-                if viz_update_counter >= viz_update_frequency:
-                    # Update visualization
-                    visualizer.add_data_point(viz_value, anomaly_marker)
-
-                    # Create stats display
-                    position += 1
-                    stats = {
-                        "current_position": position,
-                        "total_bits": position * 8,
-                        "ones_ratio": 0.5,  # Would calculate from data
-                        "byte_mean": record.byte_value,
-                        "byte_std": 0.0,
-                        "total_anomalies": 1 if record.anomaly_type else 0,
-                    }
-                    stats_display.update_stats(stats)
-
-                    viz_update_counter = 0  # Reset counter
-
-                # Control playback speed (match live mode timing)
-                await asyncio.sleep(0.02)  # Same timing as live mode
+                        # Update stats display
+                        position += 1
+                        stats["current_position"] = position
+                        stats["total_bits"] = position * 8
+                        stats["byte_mean"] = byte_value
+                        stats["total_anomalies"] = 1 if anomaly_types[i] else 0
+                        stats_display.update_stats(stats)
+
+                        # Game widgets are updated on the next repaint tick
+                        if self.game_state:
+                            self._game_stale = True
+
+                    # Wait until the next record is due, without banking a
+                    # backlog to race through after a stall
+                    now = time.monotonic()
+                    due = max(due + self.PLAYBACK_RECORD_INTERVAL, now)
+                    await asyncio.sleep(due - now)
 
         except Exception as e:
-            self.notify(f"Playback error: {e}", severity="error")
+            mode = "Game playback" if self.game_state else "Playback"
+            self.notify(f"{mode} error: {e}", severity="error")
+        finally:
+            await batches.aclose()
 
     async def cleanup(self) -> None:
         """Clean up resources with detailed status updates."""
@@ -993,14 +1611,6 @@ class RNGVisualizerApp(App):
             except (TimeoutError, asyncio.CancelledError):
                 pass  # Expected when cancelling
 
-        if self.game_timer_task and not self.game_timer_task.done():
-            cleanup_steps.append("Stopping game timer...")
-            self.game_timer_task.cancel()
-            try:
-                await asyncio.wait_for(self.game_timer_task, timeout=1.0)
-            except (TimeoutError, asyncio.CancelledError):
-                pass  # Expected when cancelling
-
         if self.device and self.device.is_connected:
             cleanup_steps.append("Disconnecting from device...")
             self.device.disconnect()
@@ -1008,7 +1618,7 @@ class RNGVisualizerApp(App):
         if self.writer:
             cleanup_steps.append("Closing capture file...")
             try:
-                self.writer.__exit__(None, None, None)
+                self._close_writer()
                 cleanup_steps.append("✓ Capture file saved successfully")
             except Exception as e:
                 cleanup_steps.append(f"⚠ Error closing file: {e}")
@@ -1024,205 +1634,53 @@ class RNGVisualizerApp(App):
         try:
             if self.device and self.device.is_connected:
                 self.device.disconnect()
-        except:
+        except Exception:
             pass
 
         try:
             if self.writer:
-                self.writer.__exit__(None, None, None)
-        except:
-            pass
-
-    def _update_game_widgets(self) -> None:
-        """Update all game-related widgets with current state."""
-        if not self.game_state:
-            return
-
-        try:
-            # Update instruction display
-            instruction_display = self.query_one(
-                "#game_instruction", GameInstructionDisplay
-            )
-            instruction_display.update_game_state(self.game_state)
-
-            # Update current bucket display
-            bucket_display = self.query_one("#current_bucket", CurrentBucketDisplay)
-            bucket_display.update_game_state(self.game_state)
-
-            # Update history display (now in left panel)
-            history_display = self.query_one("#game_history_left", GameHistoryDisplay)
-            history_display.update_game_state(self.game_state)
-
-            # Update overall stats display
-            overall_display = self.query_one("#game_overall", GameOverallStats)
-            overall_display.update_game_state(self.game_state)
+                self._close_writer()
         except Exception:
-            # Widgets might not be initialized yet
             pass
 
-    async def _game_timer_loop(self) -> None:
-        """Timer loop for managing game turns."""
-        while (
-            not self._shutting_down
-            and self.game_state
-            and not self.game_state.is_finished
-        ):
-            if self.is_paused:
-                await asyncio.sleep(0.1)
-                continue
+    def repaint_widgets(self) -> None:
+        """Push flagged state into the widgets and repaint the dirty ones.
 
-            current_turn = self.game_state.current_turn
-            if current_turn and current_turn.is_expired():
-                # Start new turn
-                self.game_state.start_new_turn()
-                self._update_game_widgets()
-
-            # Update UI frequently to show countdown
+        Capture loops only flag what changed, so statistics are summarized
+        and game widgets updated at most once per tick however fast data
+        arrives, and all repaints go out as a single screen update. The tick
+        also drives the game turn timer.
+        """
+        if self.game_state:
+            self._tick_game()
+        if self._stats_stale and self.analyzer and self._stats_display:
+            self._stats_stale = False
+            self._stats_display.update_stats(self.analyzer.get_summary_stats())
+        if self._game_stale:
+            self._game_stale = False
             self._update_game_widgets()
-            await asyncio.sleep(0.1)  # Update 10 times per second
-
-    async def _game_capture_loop(self) -> None:
-        """Game capture loop - same as normal capture but with game logic."""
-        if not self.device or not self.analyzer:
-            return
-
-        visualizer = self.query_one("#visualizer", BitstreamVisualizer)
-        stats_display = self.query_one("#stats_display", StatsDisplay)
 
-        # Counter to throttle visualization updates
-        viz_update_counter = 0
-        viz_update_frequency = 10  # Same as normal mode
+        with self.batch_update():
+            for widget in self._throttled_widgets:
+                widget.refresh_if_dirty()
 
-        try:
-            for chunk in self.device.stream_bytes(chunk_size=10):
-                # Check for shutdown or pause
-                if self._shutting_down:
-                    break
-                if self.is_paused:
-                    await asyncio.sleep(0.1)
-                    continue
-
-                for byte_val in chunk:
-                    # Analyze byte for anomalies
-                    anomalies = self.analyzer.add_byte(byte_val)
-
-                    # Add anomalies to game state
-                    for anomaly in anomalies:
-                        if self.game_state:
-                            self.game_state.add_anomaly(anomaly)
-
-                    # Calculate visualization value (same as normal mode)
-                    viz_value = (byte_val - 127.5) / 127.5
-
-                    # Check for anomalies
-                    anomaly_marker = None
-                    if anomalies:
-                        strongest = max(anomalies, key=lambda a: abs(a.z_score))
-                        anomaly_marker = strongest.significance_level
-                        viz_value = strongest.z_score / 5.0
-                        viz_value = max(-1, min(1, viz_value))
-
-                    # Only update visualization every few bytes
-                    viz_update_counter += 1
-                    if viz_update_counter >= viz_update_frequency:
-                        # Update visualization
-                        visualizer.add_data_point(viz_value, anomaly_marker)
-
-                        # Update statistics
-                        stats = self.analyzer.get_summary_stats()
-                        stats_display.update_stats(stats)
-
-                        # Update game widgets
-                        self._update_game_widgets()
-
-                        viz_update_counter = 0
-
-                    # Save to file if writer available
-                    if self.writer:
-                        record = BitstreamRecord(
-                            position=self.analyzer.position,
-                            timestamp=time.time(),
-                            byte_value=byte_val,
-                            anomaly_type=anomalies[0].test_type if anomalies else None,
-                            z_score=anomalies[0].z_score if anomalies else None,
-                            p_value=anomalies[0].p_value if anomalies else None,
-                            significance=anomalies[0].significance_level
-                            if anomalies
-                            else None,
-                        )
-                        self.writer.write_record(record)
-
-                # Small delay to control update rate
-                await asyncio.sleep(0.02)
-
-        except Exception as e:
-            self.notify(f"Game capture error: {e}", severity="error")
-
-    async def _game_playback_loop(self) -> None:
-        """Game playback loop for replaying game files."""
-        if not self.reader:
+    def _update_game_widgets(self) -> None:
+        """Update all game-related widgets with current state."""
+        # Game widgets are only looked up on mount in game mode
+        if not self.game_state or self._game_widgets is None:
             return
 
-        visualizer = self.query_one("#visualizer", BitstreamVisualizer)
-        stats_display = self.query_one("#stats_display", StatsDisplay)
-
-        # Initialize analyzer for game replay
-        self.analyzer = RandomnessAnalyzer(window_size=1000, sensitivity=0.01)
-
-        # Counter to throttle visualization updates
-        viz_update_counter = 0
-        viz_update_frequency = 10
-
-        try:
-            position = 0
-            for record in self.reader.iter_records():
-                # Check for shutdown or pause
-                if self._shutting_down:
-                    break
-                if self.is_paused:
-                    await asyncio.sleep(0.1)
-                    continue
-
-                # Re-analyze the byte to trigger game logic
-                anomalies = self.analyzer.add_byte(record.byte_value)
-
-                # Add anomalies to game state for replay
-                for anomaly in anomalies:
-                    if self.game_state:
-                        self.game_state.add_anomaly(anomaly)
-
-                # Calculate visualization value
-                viz_value = (record.byte_value - 127.5) / 127.5
-
-                # Use recorded anomaly data for visualization
-                anomaly_marker = record.significance
-                if record.z_score is not None:
-                    viz_value = record.z_score / 5.0
-                    viz_value = max(-1, min(1, viz_value))
-
-                # Update visualization and stats
-                viz_update_counter += 1
-                if viz_update_counter >= viz_update_frequency:
-                    visualizer.add_data_point(viz_value, anomaly_marker)
+        for widget in self._game_widgets:
+            widget.update_game_state(self.game_state)
 
-                    position += 1
-                    stats = {
-                        "current_position": position,
-                        "total_bits": position * 8,
-                        "ones_ratio": 0.5,
-                        "byte_mean": record.byte_value,
-                        "byte_std": 0.0,
-                        "total_anomalies": 1 if record.anomaly_type else 0,
-                    }
-                    stats_display.update_stats(stats)
-
-                    # Update game widgets
-                    self._update_game_widgets()
-
-                    viz_update_counter = 0
+    def _tick_game(self) -> None:
+        """Start the next game turn once the current one expires."""
+        if self._shutting_down or self.is_paused or self.game_state.is_finished:
+            return
 
-                # Control playback speed
-                await asyncio.sleep(0.02)
+        current_turn = self.game_state.current_turn
+        if current_turn and current_turn.is_expired():
+            self.game_state.start_new_turn()
 
-        except Exception as e:
-            self.notify(f"Game playback error: {e}", severity="error")
+        # Widgets only repaint when the countdown they show changes
+        self._game_stale = True
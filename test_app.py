@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Tests for writing captured records from the app."""
+
+import threading
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from rng_viz.data.storage import (
+    BitstreamReader,
+    BitstreamWriter,
+    create_capture_metadata,
+)
+from rng_viz.ui.app import RNGVisualizerApp, _WriterThread
+
+
+class FailingWriter(BitstreamWriter):
+    """CSV writer whose disk fills up after a number of batches."""
+
+    def __init__(self, filepath: Path, batches_before_error: int):
+        super().__init__(filepath, create_capture_metadata({}, 1000, 0.01))
+        self.batches_left = batches_before_error
+
+    def write_batch(self, *batch) -> None:
+        if not self.batches_left:
+            raise OSError("No space left on device")
+        self.batches_left -= 1
+        super().write_batch(*batch)
+
+
+def writer_threads() -> list[threading.Thread]:
+    """Capture writer threads still alive in this process."""
+    return [t for t in threading.enumerate() if t.name == "capture-writer"]
+
+
+def capturing_app(writer: BitstreamWriter) -> RNGVisualizerApp:
+    """An app that has opened a capture file, as live mode does."""
+    app = RNGVisualizerApp()
+    app.writer = writer
+    writer.__enter__()
+    app._writer_thread = _WriterThread(writer, app.WRITE_QUEUE_SIZE)
+    return app
+
+
+def save_chunks(app: RNGVisualizerApp, n_chunks: int, chunk_size: int = 100) -> None:
+    """Hand chunks of captured bytes to the app, as the capture loop does."""
+    for i in range(n_chunks):
+        data = np.full(chunk_size, i, dtype=np.uint8)
+        app._save_chunk(data, i * chunk_size + 1, 1e9 + i, [])
+
+
+def test_writer_thread_writes_all_queued_batches(tmp_path):
+    """close() waits until every queued batch is written, in order."""
+    path = tmp_path / "capture.csv"
+    writer = BitstreamWriter(path, create_capture_metadata({}, 1000, 0.01))
+    with writer:
+        writer_thread = _WriterThread(writer, queue_size=2)
+        for i in range(20):
+            positions = np.arange(i * 100 + 1, i * 100 + 101)
+            writer_thread.write_batch(
+                positions, np.full(100, 1e9 + i), positions % 256, {}
+            )
+        writer_thread.close()
+    assert not writer_threads()
+
+    positions = [row[0] for row in BitstreamReader(path).iter_rows()]
+    assert positions == list(range(1, 2001))
+
+
+def test_close_writer_flushes_and_closes(tmp_path):
+    """Shutting down writes out buffered records and closes the file."""
+    path = tmp_path / "capture.csv"
+    app = capturing_app(BitstreamWriter(path, create_capture_metadata({}, 1, 0.01)))
+    # More than a write batch, so some go through the queue and some are pending
+    save_chunks(app, 50)
+    assert app._pending_records.data
+
+    app._close_writer()
+
+    assert app._writer_thread is None
+    assert not writer_threads()
+    assert app.writer.csv_file.closed
+    stats = BitstreamReader(path).get_file_stats()
+    assert stats["total_records"] == 5000
+
+
+def test_close_writer_after_write_error(tmp_path):
+    """A failed write is re-raised, with the thread stopped and the file closed."""
+    path = tmp_path / "capture.csv"
+    app = capturing_app(FailingWriter(path, batches_before_error=1))
+    save_chunks(app, 50)
+
+    with pytest.raises(OSError, match="No space left"):
+        app._close_writer()
+
+    assert app._writer_thread is None
+    assert not writer_threads()
+    assert app.writer.csv_file.closed
+    # The first batch, the 41 chunks that reached WRITE_BATCH_SIZE, is intact
+    stats = BitstreamReader(path).get_file_stats()
+    assert stats["total_records"] == 4100
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Tests for the statistical analysis of bitstreams."""
+
+import numpy as np
+import pytest
+
+from rng_viz.analysis.stats import RandomnessAnalyzer, StatisticalWindow
+
+
+def biased_bytes(n: int, seed: int = 0) -> np.ndarray:
+    """Random bytes with occasional runs of high bits, so tests fire often."""
+    rng = np.random.default_rng(seed)
+    data = rng.integers(0, 256, n, dtype=np.uint8)
+    data[rng.random(n) < 0.15] |= 0xF0
+    return data
+
+
+def recount(window_bytes: np.ndarray) -> tuple[int, int, list[int]]:
+    """Ones, bit transitions and byte histogram computed from scratch."""
+    bits = np.unpackbits(window_bytes, bitorder="little")
+    return (
+        int(bits.sum()),
+        int(np.count_nonzero(bits[1:] != bits[:-1])),
+        np.bincount(window_bytes, minlength=256).tolist(),
+    )
+
+
+def assert_window_matches(window: StatisticalWindow, expected: np.ndarray) -> None:
+    """Check a window's contents and counters against the bytes it should hold."""
+    assert window.count == len(expected)
+    assert window.as_ordered().tolist() == expected.tolist()
+    assert (
+        window.ones_count,
+        window.transitions,
+        window.histogram.tolist(),
+    ) == recount(expected)
+
+
+@pytest.mark.parametrize("window_size", [1, 2, 9, 100])
+def test_window_counts_match_recount(window_size):
+    """Incremental counters agree with a recount, filling and wrapping around."""
+    data = biased_bytes(3 * window_size + 7)
+    window = StatisticalWindow(window_size)
+
+    for i, byte in enumerate(data.tolist()):
+        window.add_byte(byte)
+        assert_window_matches(window, data[max(0, i + 1 - window_size) : i + 1])
+    assert window.is_full()
+
+
+@pytest.mark.parametrize("window_size", [1, 2, 9, 100])
+def test_extend_matches_add_byte(window_size):
+    """A bulk extend leaves the same window as adding its bytes one at a time."""
+    sizes = [0, 1, window_size - 1, window_size, 3, window_size + 5, 2, 4 * window_size]
+    data = biased_bytes(sum(sizes), seed=2)
+    extended = StatisticalWindow(window_size)
+    single = StatisticalWindow(window_size)
+
+    start = 0
+    for size in sizes:
+        chunk = data[start : start + size]
+        start += size
+        extended.extend(chunk)
+        for byte in chunk.tolist():
+            single.add_byte(byte)
+
+        assert_window_matches(extended, single.as_ordered())
+        assert_window_matches(single, data[max(0, start - window_size) : start])
+        assert extended.sum_of_squares() == single.sum_of_squares()
+
+    # bytes input takes the same path as arrays
+    extended.extend(data[:5].tobytes())
+    for byte in data[:5].tolist():
+        single.add_byte(byte)
+    assert_window_matches(extended, single.as_ordered())
+
+
+@pytest.mark.parametrize("window_size", [1, 2, 49, 50, 1000])
+def test_add_bytes_matches_add_byte(window_size):
+    """Chunked analysis flags the same positions as one byte at a time."""
+    data = biased_bytes(6 * window_size + 3000)
+    single = RandomnessAnalyzer(window_size=window_size, sensitivity=0.05)
+    chunked = RandomnessAnalyzer(window_size=window_size, sensitivity=0.05)
+
+    expected = [a for byte in data.tolist() for a in single.add_byte(byte)]
+    rng = np.random.default_rng(1)
+    found = []
+    start = 0
+    while start < len(data):
+        size = int(rng.integers(1, 3 * window_size + 300))
+        found += chunked.add_bytes(data[start : start + size])
+        start += size
+
+    assert chunked.position == single.position == len(data)
+    assert expected
+    assert [(a.position, a.test_type, a.significance_level) for a in found] == [
+        (a.position, a.test_type, a.significance_level) for a in expected
+    ]
+    assert np.allclose([a.z_score for a in found], [a.z_score for a in expected])
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""Tests for reading and writing capture files."""
+
+import csv
+import json
+import os
+import sys
+from dataclasses import asdict
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from rng_viz.data import storage
+from rng_viz.data.storage import (
+    BitstreamReader,
+    BitstreamRecord,
+    create_capture_metadata,
+    create_writer,
+)
+
+FIELDNAMES = [
+    "position",
+    "timestamp",
+    "byte_value",
+    "anomaly_type",
+    "z_score",
+    "p_value",
+    "significance",
+]
+
+
+# Values that float32 (.rngbin) stores exactly
+ANOMALY = ("runs", 3.25, 0.0078125, "**")
+
+
+def expected_rows(n_records: int, anomaly_every: int) -> list[tuple]:
+    """Rows written by write_capture, in RECORD_FIELDS order."""
+    rows = []
+    for i in range(n_records):
+        fields = ANOMALY if i % anomaly_every == 0 else (None,) * 4
+        rows.append((i + 1, 1e9 + i / 1000, i % 256, *fields))
+    return rows
+
+
+def write_capture(
+    path: Path, n_records: int = 2500, anomaly_every: int = 300, batch_size: int = 1000
+):
+    """Write a capture in the format implied by the file extension.
+
+    Returns:
+        Metadata written to the file header
+    """
+    metadata = create_capture_metadata({"port": "/dev/ttyACM0"}, 1000, 0.01)
+    rows = expected_rows(n_records, anomaly_every)
+    with create_writer(path, metadata) as writer:
+        for start in range(0, n_records, batch_size):
+            batch = rows[start : start + batch_size]
+            positions, timestamps, byte_values = (
+                np.array(column) for column in list(zip(*batch, strict=True))[:3]
+            )
+            anomalies = {i: row[3:] for i, row in enumerate(batch) if row[3]}
+            writer.write_batch(positions, timestamps, byte_values, anomalies)
+    return metadata
+
+
+def assert_round_trip(path: Path, n_records: int = 2500, anomaly_every: int = 300):
+    """Check that every reader query returns what write_capture wrote."""
+    metadata = write_capture(path, n_records, anomaly_every)
+    rows = expected_rows(n_records, anomaly_every)
+    anomaly_rows = [row for row in rows if row[3]]
+
+    with BitstreamReader(path) as reader:
+        assert reader.load_metadata() == metadata
+        assert list(reader.iter_rows()) == rows
+        assert reader.get_anomalies() == [BitstreamRecord(*row) for row in anomaly_rows]
+        assert reader.get_records_range(1200, 1210) == [
+            BitstreamRecord(*row) for row in rows[1199:1209]
+        ]
+
+        stats = reader.get_file_stats()
+        assert stats["total_records"] == n_records
+        assert stats["anomaly_count"] == len(anomaly_rows)
+        assert stats["metadata"] == metadata.to_dict()
+
+
+def test_binary_round_trip(tmp_path):
+    """.rngbin captures read back exactly what was written."""
+    assert_round_trip(tmp_path / "capture.rngbin")
+
+
+def test_binary_header_and_array(tmp_path):
+    """The .rngbin header is magic, metadata JSON, then 8-byte aligned records."""
+    path = tmp_path / "capture.rngbin"
+    metadata = write_capture(path, n_records=10, anomaly_every=4)
+
+    with open(path, "rb") as f:
+        metadata_dict, header_size = storage._read_binary_header(f)
+    assert metadata_dict == metadata.to_dict()
+    assert header_size % 8 == 0
+    assert (
+        path.stat().st_size == header_size + 10 * storage.BINARY_RECORD_DTYPE.itemsize
+    )
+
+    records = BitstreamReader(path).load_array()
+    assert records["position"].tolist() == list(range(1, 11))
+    assert (records["flags"] != 0).tolist() == [i % 4 == 0 for i in range(10)]
+
+
+def test_binary_ignores_partial_record(tmp_path):
+    """A record still being written at the end of a .rngbin file is skipped."""
+    path = tmp_path / "capture.rngbin"
+    write_capture(path, n_records=10, anomaly_every=4)
+    with open(path, "ab") as f:
+        f.write(b"\0" * (storage.BINARY_RECORD_DTYPE.itemsize - 1))
+
+    with BitstreamReader(path) as reader:
+        assert len(reader.load_array()) == 10
+        assert len(list(reader.iter_rows())) == 10
+        assert reader.get_file_stats()["total_records"] == 10
+
+
+def write_dictwriter_capture(path: Path, n_records: int, anomaly_every: int) -> int:
+    """Write a capture the way the original csv.DictWriter-based writer did.
+
+    Returns:
+        Number of anomaly rows written
+    """
+    metadata = create_capture_metadata({}, 1000, 0.01)
+    anomalies = 0
+    with open(path, "w", newline="") as f:
+        f.write(f"# {json.dumps(asdict(metadata))}\n")
+        writer = csv.DictWriter(f, fieldnames=FIELDNAMES)
+        writer.writeheader()
+        for i in range(n_records):
+            row = {"position": i + 1, "timestamp": 1e9 + i, "byte_value": i % 256}
+            if i % anomaly_every == 0:
+                row |= {
+                    "anomaly_type": "runs",
+                    "z_score": 3.1,
+                    "p_value": 0.002,
+                    "significance": "**",
+                }
+                anomalies += 1
+            writer.writerow(row)
+    return anomalies
+
+
+@pytest.mark.parametrize("buffer_size", [storage.SCAN_BUFFER_SIZE, 7])
+def test_crlf_capture_stats(tmp_path, monkeypatch, buffer_size):
+    """CRLF rows from the original writer count as clean, across buffer seams."""
+    monkeypatch.setattr(storage, "SCAN_BUFFER_SIZE", buffer_size)
+    path = tmp_path / "old.csv"
+    anomalies = write_dictwriter_capture(path, 3000, 500)
+
+    stats = BitstreamReader(path).get_file_stats()
+    assert stats["total_records"] == 3000
+    assert stats["anomaly_count"] == anomalies == 6
+
+
+def test_parquet_round_trip(tmp_path):
+    """Parquet captures read back exactly what was written."""
+    pytest.importorskip("pyarrow")
+    assert_round_trip(tmp_path / "capture.parquet")
+
+
+def test_parquet_requires_pyarrow(tmp_path, monkeypatch):
+    """Without pyarrow, .parquet paths fail with an install hint."""
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    monkeypatch.setitem(sys.modules, "pyarrow.parquet", None)
+    metadata = create_capture_metadata({}, 1000, 0.01)
+
+    with pytest.raises(RuntimeError, match=r"rng-viz\[parquet\]"):
+        create_writer(tmp_path / "capture.parquet", metadata).__enter__()
+    with pytest.raises(RuntimeError, match=r"rng-viz\[parquet\]"):
+        BitstreamReader(tmp_path / "capture.parquet").load_metadata()
+
+
+def test_zstd_round_trip(tmp_path):
+    """zstd-compressed CSV captures read back exactly what was written."""
+    pytest.importorskip("zstandard")
+    path = tmp_path / "capture.csv.zst"
+    assert_round_trip(path)
+    # Compressed captures are always scanned, never indexed
+    assert not storage._index_path(path).exists()
+
+
+def query_capture(path: Path) -> tuple:
+    """Run the range, anomaly and stats queries on a fresh reader."""
+    ranges = [(0, 50), (9_990, 10_010), (19_999, 20_002), (24_990, 30_000)]
+    with BitstreamReader(path) as reader:
+        stats = reader.get_file_stats()
+        return (
+            [reader.get_records_range(start, end) for start, end in ranges],
+            reader.get_anomalies(),
+            (stats["total_records"], stats["anomaly_count"]),
+        )
+
+
+@pytest.fixture
+def indexed_capture(tmp_path):
+    """A CSV capture spanning several index intervals, with its .idx sidecar."""
+    path = tmp_path / "capture.csv"
+    write_capture(path, n_records=25_000, anomaly_every=700, batch_size=3000)
+    assert storage._index_path(path).exists()
+    return path
+
+
+def test_index_matches_full_parse(indexed_capture):
+    """Queries answer the same with and without the .idx sidecar."""
+    with BitstreamReader(indexed_capture) as reader:
+        assert reader.load_index() is not None
+    indexed = query_capture(indexed_capture)
+
+    storage._index_path(indexed_capture).unlink()
+    with BitstreamReader(indexed_capture) as reader:
+        assert reader.load_index() is None
+    assert query_capture(indexed_capture) == indexed
+
+    ranges, anomalies, counts = indexed
+    assert [len(records) for records in ranges] == [49, 20, 3, 11]
+    assert len(anomalies) == counts[1] == 36
+    assert counts[0] == 25_000
+
+
+def test_stale_index_is_ignored(indexed_capture):
+    """An .idx older than its capture falls back to a full parse."""
+    expected = query_capture(indexed_capture)
+    index_path = storage._index_path(indexed_capture)
+    index_path.write_text(
+        json.dumps(
+            {
+                "total_records": 1,
+                "anomaly_count": 0,
+                "row_index": [],
+                "anomaly_offsets": [],
+            }
+        )
+    )
+    mtime_ns = indexed_capture.stat().st_mtime_ns - 10**9
+    os.utime(index_path, ns=(mtime_ns, mtime_ns))
+
+    with BitstreamReader(indexed_capture) as reader:
+        assert reader.load_index() is None
+    assert query_capture(indexed_capture) == expected
+
+
+def test_corrupt_index_is_ignored(indexed_capture):
+    """A truncated .idx falls back to a full parse."""
+    expected = query_capture(indexed_capture)
+    index_path = storage._index_path(indexed_capture)
+    index_path.write_text(index_path.read_text()[:100])
+
+    with BitstreamReader(indexed_capture) as reader:
+        assert reader.load_index() is None
+    assert query_capture(indexed_capture) == expected
+
+
+def test_index_reloaded_when_capture_rewritten(indexed_capture):
+    """A reader drops its cached .idx once the capture it indexes changes."""
+    reader = BitstreamReader(indexed_capture)
+    assert len(reader.get_anomalies()) == 36
+    mtime_ns = indexed_capture.stat().st_mtime_ns
+
+    # Different rows at different byte offsets, with a fresh sidecar
+    write_capture(indexed_capture, n_records=20_000, anomaly_every=900)
+    for path in (indexed_capture, storage._index_path(indexed_capture)):
+        os.utime(path, ns=(mtime_ns + 10**9, mtime_ns + 10**9))
+
+    rows = expected_rows(20_000, 900)
+    assert reader.get_anomalies() == [BitstreamRecord(*row) for row in rows if row[3]]
+    assert reader.get_records_range(9_990, 10_010) == [
+        BitstreamRecord(*row) for row in rows[9_989:10_009]
+    ]
+    assert reader.get_file_stats()["total_records"] == 20_000
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Tests for the TrueRNG background reader, using a pipe as the serial port."""
+
+import os
+import threading
+
+import pytest
+import serial
+
+from rng_viz.device.truerng import TrueRNGDevice, _make_selector
+
+
+class PipeSerial:
+    """Stands in for serial.Serial, reading from the read end of a pipe."""
+
+    def __init__(self):
+        self.read_fd, self.write_fd = os.pipe()
+        self.is_open = True
+
+    def fileno(self) -> int:
+        return self.read_fd
+
+    def close(self) -> None:
+        if self.is_open:
+            self.is_open = False
+            os.close(self.read_fd)
+
+
+@pytest.fixture
+def device():
+    """A connected device whose port is a pipe nothing has written to yet."""
+    conn = PipeSerial()
+    device = TrueRNGDevice(port="pipe")
+    device.serial_conn = conn
+    device.is_connected = True
+    device._selector = _make_selector(conn)
+    yield device
+    disconnect_within(device)
+    if conn.write_fd is not None:
+        os.close(conn.write_fd)
+
+
+def reader_threads() -> list[threading.Thread]:
+    """Reader threads still alive in this process."""
+    return [t for t in threading.enumerate() if t.name == "truerng-reader"]
+
+
+def disconnect_within(device: TrueRNGDevice, timeout: float = 5.0) -> None:
+    """Disconnect on a helper thread, failing instead of hanging if it blocks."""
+    helper = threading.Thread(target=device.disconnect, daemon=True)
+    helper.start()
+    helper.join(timeout)
+    assert not helper.is_alive(), "disconnect() did not return"
+
+
+def test_disconnect_wakes_idle_reader(device):
+    """disconnect() wakes a reader blocked in select and joins it."""
+    device.start_streaming()
+    thread = device._reader_thread
+    wakeup = device._wakeup
+    assert thread is not None and thread.is_alive()
+    assert wakeup is not None
+
+    disconnect_within(device)
+
+    assert not thread.is_alive()
+    assert not reader_threads()
+    assert device._reader_thread is None
+    assert device._wakeup is None
+    assert not device.serial_conn.is_open
+    for fd in wakeup:
+        with pytest.raises(OSError):
+            os.fstat(fd)
+
+
+def test_stream_bytes_yields_pipe_data(device):
+    """Bytes written to the port come out of stream_bytes as read."""
+    os.write(device.serial_conn.write_fd, b"\x01\x02\x03")
+    stream = device.stream_bytes()
+    assert next(stream) == b"\x01\x02\x03"
+
+    # Closing the generator disconnects and stops the reader
+    stream.close()
+    assert not device.is_connected
+    assert not reader_threads()
+
+
+def test_reader_reports_disconnected_device(device):
+    """A port that reads as EOF surfaces as an error from stream_bytes."""
+    conn = device.serial_conn
+    os.close(conn.write_fd)
+    conn.write_fd = None
+
+    with pytest.raises(serial.SerialException, match="disconnected"):
+        next(device.stream_bytes())
+    assert not device.is_connected
+    assert not reader_threads()